@@ -0,0 +1,63 @@
+import asyncio
+import subprocess
+import sys
+import time
+
+from py_sui_async import keys
+from py_sui_async.client import Client
+
+
+class Benchmark:
+    @staticmethod
+    async def import_time(repeats: int = 5):
+        """Cold import of the client module in a fresh interpreter."""
+        code = 'import time; start = time.perf_counter(); import py_sui_async.client; ' \
+               'print(time.perf_counter() - start)'
+        results = []
+        for _ in range(repeats):
+            output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+            results.append(float(output))
+
+        print(f'Import py_sui_async.client: best {min(results) * 1000:.1f} ms, '
+              f'worst {max(results) * 1000:.1f} ms')
+        print('----------------------------------------------------------------------------')
+
+    @staticmethod
+    async def construction_time(number: int = 1_000):
+        """Client construction with precomputed accounts and with async derivation."""
+        mnemonics = [keys.generate_mnemonic() for _ in range(number)]
+        accounts = keys.derive_accounts(mnemonics)
+
+        start = time.perf_counter()
+        clients = [Client(mnemonic, account=account) for mnemonic, account in zip(mnemonics, accounts)]
+        elapsed = time.perf_counter() - start
+        print(f'Client(account=...): {elapsed / number * 1_000_000:.1f} us per client')
+        for client in clients:
+            await client.close()
+
+        number = min(number, 100)
+        start = time.perf_counter()
+        clients = await asyncio.gather(*[Client.create(mnemonic) for mnemonic in mnemonics[:number]])
+        elapsed = time.perf_counter() - start
+        print(f'await Client.create(mnemonic): {elapsed / number * 1000:.2f} ms per client')
+        for client in clients:
+            await client.close()
+
+        start = time.perf_counter()
+        clients = [Client(mnemonic) for mnemonic in mnemonics[:number]]
+        elapsed = time.perf_counter() - start
+        print(f'Client(mnemonic): {elapsed / number * 1000:.2f} ms per client')
+        for client in clients:
+            await client.close()
+
+        print('----------------------------------------------------------------------------')
+
+
+async def main():
+    benchmark = Benchmark()
+    await benchmark.import_time()
+    await benchmark.construction_time()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+import asyncio
+from typing import Optional, Dict, List, Tuple
+
+from py_sui_async import exceptions
+from py_sui_async.routing import EndpointState
+
+
+class Batcher:
+    def __init__(self, window: float = 0.005, max_size: int = 100) -> None:
+        self.window = window
+        self.max_size = max_size
+        self._queues: Dict[tuple, Tuple[object, EndpointState, List[Tuple[dict, asyncio.Future]]]] = {}
+        self._timers: Dict[tuple, asyncio.TimerHandle] = {}
+
+    async def submit(self, client, json_data: dict) -> Optional[dict]:
+        from py_sui_async.rpc_methods import RPC, is_read
+
+        if not is_read(json_data):
+            return await RPC.send(client=client, json_data=json_data)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        address = client.account.address if client.account else None
+        endpoint = client.transport.router(client.network).for_address(address)
+        key = (endpoint.url, client.proxy)
+        if key not in self._queues:
+            self._queues[key] = (client, endpoint, [])
+
+        queue = self._queues[key][2]
+        queue.append((json_data, future))
+        if len(queue) >= self.max_size:
+            self._schedule_flush(key)
+
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.window, self._schedule_flush, key)
+
+        return await future
+
+    def _schedule_flush(self, key: tuple) -> None:
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+
+        client, endpoint, queue = self._queues.pop(key, (None, None, []))
+        if queue:
+            asyncio.ensure_future(self._flush(client, endpoint, queue))
+
+    @staticmethod
+    async def _flush(client, endpoint: EndpointState, queue: List[Tuple[dict, asyncio.Future]]) -> None:
+        from py_sui_async.rpc_methods import RPC
+
+        try:
+            if len(queue) == 1:
+                json_data, future = queue[0]
+                responses = [await RPC.send(client=client, json_data=json_data, endpoint=endpoint)]
+
+            else:
+                responses = await RPC.send(client=client, json_data=[json_data for json_data, _ in queue],
+                                           endpoint=endpoint)
+
+        except Exception as e:
+            for _, future in queue:
+                if not future.done():
+                    future.set_exception(e)
+
+            return
+
+        if not isinstance(responses, list):
+            responses = [responses]
+
+        responses = {response.get('id'): response for response in responses if isinstance(response, dict)}
+        for json_data, future in queue:
+            if future.done():
+                continue
+
+            response = responses.get(json_data['id'])
+            if response is None:
+                future.set_exception(exceptions.RPCException(code=-32603, message='No response in the batch'))
+
+            elif 'error' in response:
+                error = response['error']
+                future.set_exception(exceptions.RPCException(code=error['code'], message=error['message']))
+
+            else:
+                future.set_result(response)
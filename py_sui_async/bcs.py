@@ -0,0 +1,232 @@
+import base64
+from typing import Optional, List, Union, Any, Callable
+
+from py_sui_async.models import OwnedObject, ObjectID
+
+BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+INTEGER_SIZES = {'u8': 1, 'u16': 2, 'u32': 4, 'u64': 8, 'u128': 16, 'u256': 32}
+TYPE_TAGS = {'bool': 0, 'u8': 1, 'u64': 2, 'u128': 3, 'address': 4, 'signer': 5, 'u16': 8, 'u32': 9, 'u256': 10}
+VECTOR_TAG = 6
+STRUCT_TAG = 7
+
+
+class SingleTransactionKind:
+    TransferObject = 0
+    Publish = 1
+    Call = 2
+    TransferSui = 3
+    Pay = 4
+    PaySui = 5
+    PayAllSui = 6
+
+
+def uleb128(value: int) -> bytes:
+    result = bytearray()
+    while True:
+        byte = value & 0x7f
+        value >>= 7
+        if value:
+            result.append(byte | 0x80)
+
+        else:
+            result.append(byte)
+            return bytes(result)
+
+
+def integer(value: int, type_: str = 'u64') -> bytes:
+    return int(value).to_bytes(INTEGER_SIZES[type_], 'little')
+
+
+def byte_vector(value: bytes) -> bytes:
+    return uleb128(len(value)) + value
+
+
+def string(value: str) -> bytes:
+    return byte_vector(value.encode())
+
+
+def sequence(items: list, encoder: Callable[[Any], bytes]) -> bytes:
+    return uleb128(len(items)) + b''.join(encoder(item) for item in items)
+
+
+def address(value: str, length: int = 32) -> bytes:
+    value = value[2:] if value.startswith('0x') else value
+    return bytes.fromhex(value.rjust(length * 2, '0'))
+
+
+def decode_digest(digest: str) -> bytes:
+    try:
+        decoded = base64.b64decode(digest, validate=True)
+        if len(decoded) == 32:
+            return decoded
+
+    except ValueError:
+        pass
+
+    number = 0
+    for char in digest:
+        number = number * 58 + BASE58_ALPHABET.index(char)
+
+    decoded = number.to_bytes((number.bit_length() + 7) // 8, 'big')
+    return b'\x00' * (len(digest) - len(digest.lstrip('1'))) + decoded
+
+
+def split_type_arguments(value: str) -> List[str]:
+    arguments = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(value):
+        if char == '<':
+            depth += 1
+
+        elif char == '>':
+            depth -= 1
+
+        elif char == ',' and not depth:
+            arguments.append(value[start:i].strip())
+            start = i + 1
+
+    arguments.append(value[start:].strip())
+    return [argument for argument in arguments if argument]
+
+
+def type_tag(value: str, length: int = 32) -> bytes:
+    value = value.strip()
+    if value in TYPE_TAGS:
+        return bytes([TYPE_TAGS[value]])
+
+    if value.startswith('vector<'):
+        return bytes([VECTOR_TAG]) + type_tag(value[7:-1], length)
+
+    type_params = []
+    if '<' in value:
+        type_params = split_type_arguments(value[value.index('<') + 1:-1])
+        value = value[:value.index('<')]
+
+    package, module, name = value.split('::')
+    return bytes([STRUCT_TAG]) + address(package, length) + string(module) + string(name) + sequence(
+        type_params, lambda param: type_tag(param, length)
+    )
+
+
+def object_ref(obj: Union[OwnedObject, ObjectID], length: int = 32) -> bytes:
+    if isinstance(obj, ObjectID):
+        obj = OwnedObject(object_id=obj.id, version=obj.version, digest=obj.digest)
+
+    return address(obj.object_id, length) + integer(obj.version) + byte_vector(decode_digest(obj.digest))
+
+
+class Pure:
+    def __init__(self, value: Any, type_: str = 'u64') -> None:
+        self.value = value
+        self.type_ = type_
+
+    def value_bytes(self, value: Any, type_: str, length: int) -> bytes:
+        if type_ in INTEGER_SIZES:
+            return integer(value, type_)
+
+        if type_ == 'bool':
+            return bytes([1 if value else 0])
+
+        if type_ == 'address':
+            return address(value, length)
+
+        if type_ in ('string', '0x1::string::String', '0x1::ascii::String'):
+            return string(value)
+
+        if type_.startswith('vector<'):
+            item_type = type_[7:-1]
+            if item_type == 'u8' and isinstance(value, (bytes, str)):
+                return byte_vector(value.encode() if isinstance(value, str) else value)
+
+            return sequence(value, lambda item: self.value_bytes(item, item_type, length))
+
+        raise ValueError(f'Unsupported pure argument type: {type_}')
+
+    def encode(self, length: int = 32) -> bytes:
+        return bytes([0]) + byte_vector(self.value_bytes(self.value, self.type_, length))
+
+
+class ObjectArg:
+    def __init__(self, obj: Union[OwnedObject, ObjectID, None] = None, shared_id: Optional[str] = None,
+                 initial_shared_version: Optional[int] = None) -> None:
+        self.obj = obj
+        self.shared_id = shared_id
+        self.initial_shared_version = initial_shared_version
+
+    def object_arg(self, length: int = 32) -> bytes:
+        if self.shared_id:
+            return bytes([1]) + address(self.shared_id, length) + integer(self.initial_shared_version)
+
+        return bytes([0]) + object_ref(self.obj, length)
+
+    def encode(self, length: int = 32) -> bytes:
+        return bytes([1]) + self.object_arg(length)
+
+
+class ObjVec:
+    def __init__(self, objects: List[ObjectArg]) -> None:
+        self.objects = objects
+
+    def encode(self, length: int = 32) -> bytes:
+        return bytes([2]) + sequence(self.objects, lambda obj: obj.object_arg(length))
+
+
+CallArg = Union[Pure, ObjectArg, ObjVec]
+
+
+class TransactionBuilder:
+    def __init__(self, sender: str) -> None:
+        self.sender = sender
+        self.length = (len(sender) - 2) // 2 if sender.startswith('0x') else len(sender) // 2
+
+    def transfer_object(self, recipient: str, obj: Union[OwnedObject, ObjectID]) -> bytes:
+        return bytes([SingleTransactionKind.TransferObject]) + address(recipient, self.length) + object_ref(
+            obj, self.length
+        )
+
+    def transfer_sui(self, recipient: str, amount: Optional[int] = None) -> bytes:
+        amount_bytes = bytes([1]) + integer(amount) if amount is not None else bytes([0])
+        return bytes([SingleTransactionKind.TransferSui]) + address(recipient, self.length) + amount_bytes
+
+    def _pay(self, kind: int, coins: List[Union[OwnedObject, ObjectID]], recipients: List[str],
+             amounts: List[int]) -> bytes:
+        return bytes([kind]) + sequence(coins, lambda obj: object_ref(obj, self.length)) + sequence(
+            recipients, lambda recipient: address(recipient, self.length)
+        ) + sequence(amounts, integer)
+
+    def pay(self, coins: List[Union[OwnedObject, ObjectID]], recipients: List[str], amounts: List[int]) -> bytes:
+        return self._pay(SingleTransactionKind.Pay, coins, recipients, amounts)
+
+    def pay_sui(self, coins: List[Union[OwnedObject, ObjectID]], recipients: List[str], amounts: List[int]) -> bytes:
+        return self._pay(SingleTransactionKind.PaySui, coins, recipients, amounts)
+
+    def pay_all_sui(self, coins: List[Union[OwnedObject, ObjectID]], recipient: str) -> bytes:
+        return bytes([SingleTransactionKind.PayAllSui]) + sequence(
+            coins, lambda obj: object_ref(obj, self.length)
+        ) + address(recipient, self.length)
+
+    def move_call(self, package: Union[OwnedObject, ObjectID], module: str, function: str,
+                  type_arguments: Optional[List[str]], arguments: List[CallArg]) -> bytes:
+        return bytes([SingleTransactionKind.Call]) + object_ref(package, self.length) + string(module) + string(
+            function
+        ) + sequence(type_arguments or [], lambda tag: type_tag(tag, self.length)) + sequence(
+            arguments, lambda argument: argument.encode(self.length)
+        )
+
+    def merge_coins(self, package: Union[OwnedObject, ObjectID], coin_type: str,
+                    primary_coin: Union[OwnedObject, ObjectID], coin_to_merge: Union[OwnedObject, ObjectID]) -> bytes:
+        return self.move_call(package=package, module='pay', function='join', type_arguments=[coin_type],
+                              arguments=[ObjectArg(primary_coin), ObjectArg(coin_to_merge)])
+
+    def build(self, kinds: Union[bytes, List[bytes]], gas: Union[OwnedObject, ObjectID], gas_price: int,
+              gas_budget: int) -> bytes:
+        if isinstance(kinds, bytes):
+            kind = bytes([0]) + kinds
+
+        else:
+            kind = bytes([1]) + uleb128(len(kinds)) + b''.join(kinds)
+
+        return kind + address(self.sender, self.length) + object_ref(gas, self.length) + integer(
+            gas_price
+        ) + integer(gas_budget)
@@ -0,0 +1,109 @@
+import json
+import sqlite3
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple
+
+IMMUTABLE_METHODS = (
+    'sui_getTransaction', 'sui_getCheckpointContents', 'sui_getCheckpointContentsByDigest',
+    'sui_getCheckpointSummary', 'sui_getCheckpointSummaryByDigest', 'sui_getMoveFunctionArgTypes',
+    'sui_getNormalizedMoveFunction', 'sui_getNormalizedMoveModule', 'sui_getNormalizedMoveModulesByPackage',
+    'sui_getNormalizedMoveStruct', 'sui_tryGetPastObject'
+)
+
+
+class ResponseCache:
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, path: Optional[str] = None) -> None:
+        self.max_bytes = max_bytes
+        self.path = path
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Tuple[dict, int]] = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        if self.path:
+            self._db = sqlite3.connect(self.path)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+            self._db.commit()
+
+    @staticmethod
+    def _key(network: str, request: dict) -> str:
+        return f"{network}|{request['method']}|{json.dumps(request['params'], sort_keys=True)}"
+
+    @staticmethod
+    def cacheable(request: dict, response: Optional[dict] = None) -> bool:
+        if request.get('method') not in IMMUTABLE_METHODS:
+            return False
+
+        if response is None:
+            return True
+
+        result = response.get('result')
+        if 'error' in response or result is None:
+            return False
+
+        if request['method'] == 'sui_tryGetPastObject':
+            return result.get('status') == 'VersionFound'
+
+        if request['method'] == 'sui_getTransaction':
+            return isinstance(result, dict) and result.get('timestamp_ms') is not None
+
+        return True
+
+    def _remember(self, key: str, result: dict, size: int) -> None:
+        if key in self._entries:
+            self.size -= self._entries.pop(key)[1]
+
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = (result, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            self.size -= self._entries.popitem(last=False)[1][1]
+
+    def get(self, network: str, request: dict) -> Optional[dict]:
+        if not self.cacheable(request):
+            return None
+
+        key = self._key(network, request)
+        entry = self._entries.get(key)
+        if entry:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        if self._db:
+            row = self._db.execute('SELECT value FROM responses WHERE key = ?', (key,)).fetchone()
+            if row:
+                result = json.loads(row[0])
+                self._remember(key, result, len(row[0]))
+                self.hits += 1
+                return result
+
+        self.misses += 1
+        return None
+
+    def put(self, network: str, request: dict, response: dict) -> None:
+        if not self.cacheable(request, response):
+            return
+
+        key = self._key(network, request)
+        value = json.dumps(response['result'])
+        self._remember(key, response['result'], len(value))
+        if self._db:
+            self._db.execute('INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)', (key, value))
+            self._db.commit()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+        if self._db:
+            self._db.execute('DELETE FROM responses')
+            self._db.commit()
+
+    def close(self) -> None:
+        if self._db:
+            self._db.close()
+            self._db = None
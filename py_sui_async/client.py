@@ -1,27 +1,49 @@
+import asyncio
 import base64
-import hashlib
-from typing import Optional
+from concurrent.futures import Executor
+from typing import Optional, List
 
-import bip_utils
-import requests
-from fake_useragent import UserAgent
-from nacl.encoding import Base64Encoder
+import aiohttp
 from nacl.signing import SigningKey
 
-from py_sui_async import exceptions
+from py_sui_async import exceptions, keys
+from py_sui_async.batcher import Batcher
+from py_sui_async.cache import ResponseCache
+from py_sui_async.confirmations import ConfirmationTracker
+from py_sui_async.events import Events
+from py_sui_async.history_store import HistoryStore
 from py_sui_async.models import Network, Networks, WalletInfo, SignatureScheme, ExecuteType, StringAndBytes
 from py_sui_async.nfts import NFT
+from py_sui_async.object_store import ObjectStore
+from py_sui_async.reservations import CoinReservations
 from py_sui_async.rpc_methods import RPC
 from py_sui_async.transactions import Transaction
+from py_sui_async.transport import Transport
+from py_sui_async.utils import get_effects, get_digest, get_user_agent
 from py_sui_async.wallet import Wallet
 
+INTENT_PREFIX = bytes([0, 0, 0])
+SIGNATURE_SCHEME_PREFIX = bytes([SignatureScheme.ED25519])
+
 
 class Client:
     def __init__(self, mnemonic: Optional[str] = None, network: Network = Networks.Testnet,
                  derivation_path: str = "m/44'/784'/0'/0'/0'", proxy: Optional[str] = None,
-                 check_proxy: bool = True) -> None:
+                 check_proxy: bool = True, transport: Optional[Transport] = None,
+                 batcher: Optional[Batcher] = None, cache: Optional[ResponseCache] = None,
+                 history_store: Optional[HistoryStore] = None, object_store: bool = False,
+                 offline_build: bool = False, hedge: Optional[float] = None, retries: int = 3,
+                 account: Optional[WalletInfo] = None, user_agent: Optional[str] = None) -> None:
         self.network = network
         self.derivation_path = derivation_path
+        self._own_transport = transport is None
+        self.transport = transport or Transport()
+        self.batcher = batcher
+        self.cache = cache
+        self.history_store = history_store
+        self.offline_build = offline_build
+        self.hedge = hedge
+        self.retries = retries
 
         self.proxy = proxy
         self.headers = {
@@ -29,7 +51,7 @@ class Client:
             'accept': '*/*',
             'accept-language': 'en-US,en;q=0.9',
             'origin': 'chrome-extension://opcgpfmipidbgpenhmajoajpbobppdil',
-            'user-agent': UserAgent().chrome,
+            'user-agent': user_agent or get_user_agent(),
             'Content-type': 'application/json'
         }
 
@@ -39,6 +61,8 @@ class Client:
                     self.proxy = f'http://{self.proxy}'
 
                 if check_proxy:
+                    import requests
+
                     your_ip = requests.get(
                         'http://eth0.me/', proxies={'http': self.proxy, 'https': self.proxy}, timeout=10
                     ).text.rstrip()
@@ -48,46 +72,138 @@ class Client:
             except Exception as e:
                 raise exceptions.InvalidProxy(str(e))
 
-        self.account: Optional[WalletInfo] = None
-        if mnemonic or mnemonic is None:
-            if mnemonic is None:
-                mnemonic = bip_utils.Bip39MnemonicGenerator().FromWordsNumber(
-                    bip_utils.Bip39WordsNum.WORDS_NUM_12).ToStr()
-
-            bip39_seed = bip_utils.Bip39SeedGenerator(mnemonic).Generate()
-            bip32_ctx = bip_utils.Bip32Slip10Ed25519.FromSeed(bip39_seed)
-            bip32_der_ctx = bip32_ctx.DerivePath(self.derivation_path)
-
-            private_key = bip32_der_ctx.PrivateKey().Raw()
-            private_key = StringAndBytes(str_="0x" + str(private_key), bytes_=private_key.ToBytes())
-            public_key = bip32_der_ctx.PublicKey().RawCompressed()
-            public_key = StringAndBytes(str_="0x" + str(public_key), bytes_=public_key.ToBytes())
-            pub_key_bytes = public_key.bytes_
-            address = "0x" + hashlib.blake2b(
-                pub_key_bytes[0:33] if pub_key_bytes[0] == 0 else pub_key_bytes[0:34], digest_size=32
-            ).hexdigest()
-
-            self.account = WalletInfo(
-                mnemonic=mnemonic, private_key=private_key, public_key=public_key, address=address
-            )
+        self.account: Optional[WalletInfo] = account
+        if not self.account and (mnemonic or mnemonic is None):
+            self.account = keys.derive_account(mnemonic=mnemonic or keys.generate_mnemonic(),
+                                               derivation_path=self.derivation_path)
 
+        self._signing_key: Optional[SigningKey] = None
+        self.object_store = ObjectStore(self) if object_store and self.account else None
+        self.reservations = CoinReservations(self) if self.object_store else None
+        self.confirmations = ConfirmationTracker(self)
+        self.events = Events(self)
         self.nfts = NFT(self)
         self.transactions = Transaction(self)
         self.wallet = Wallet(self)
 
-    async def sign(self, tx_data: bytes) -> Optional[bytes]:
-        indata = bytearray([0, 0, 0])
-        indata.extend(tx_data)
+    @classmethod
+    async def create(cls, mnemonic: Optional[str] = None, derivation_path: str = keys.DEFAULT_DERIVATION_PATH,
+                     executor: Optional[Executor] = None, keystore: Optional[keys.Keystore] = None,
+                     **kwargs) -> 'Client':
+        account = kwargs.pop('account', None)
+        if not account and (mnemonic or mnemonic is None):
+            mnemonic = mnemonic or keys.generate_mnemonic()
+            account = keystore.get(mnemonic, derivation_path) if keystore else None
+            if not account:
+                account = await keys.async_derive_account(mnemonic=mnemonic, derivation_path=derivation_path,
+                                                          executor=executor)
+                if keystore:
+                    keystore.put(account, derivation_path)
+                    keystore.save()
+
+        check_proxy = kwargs.pop('check_proxy', True)
+        client = cls(mnemonic, derivation_path=derivation_path, account=account, check_proxy=False, **kwargs)
+        if client.proxy and check_proxy:
+            try:
+                await client.check_proxy()
+
+            except:
+                await client.close()
+                raise
+
+        return client
 
-        compound = bytearray([SignatureScheme.ED25519])
-        signed = SigningKey(self.account.private_key.bytes_).sign(bytes(indata), encoder=Base64Encoder).signature
-        compound.extend(base64.b64decode(signed))
-        compound.extend(self.account.public_key.bytes_[1:])
-        return base64.b64encode(bytes(compound))
+    async def check_proxy(self) -> str:
+        try:
+            session = await self.transport.get_session()
+            async with session.get('http://eth0.me/', proxy=self.proxy,
+                                   timeout=aiohttp.ClientTimeout(total=10)) as response:
+                your_ip = (await response.text()).rstrip()
 
-    async def sign_and_execute(self, tx_bytes: StringAndBytes) -> Optional[dict]:
+        except Exception as e:
+            raise exceptions.InvalidProxy(str(e))
+
+        if your_ip not in self.proxy:
+            raise exceptions.InvalidProxy(f"Proxy doesn't work! Your IP is {your_ip}.")
+
+        return your_ip
+
+    @property
+    def signing_key(self) -> SigningKey:
+        if not self._signing_key:
+            self._signing_key = SigningKey(self.account.private_key.bytes_)
+
+        return self._signing_key
+
+    def sign_sync(self, tx_data: bytes) -> bytes:
+        signature = self.signing_key.sign(INTENT_PREFIX + tx_data).signature
+        return base64.b64encode(SIGNATURE_SCHEME_PREFIX + signature + self.account.public_key.bytes_[1:])
+
+    async def sign(self, tx_data: bytes) -> Optional[bytes]:
+        return self.sign_sync(tx_data)
+
+    async def sign_many(self, tx_datas: List[bytes], executor: Optional[Executor] = None,
+                        threshold: int = 256, chunk_size: int = 128) -> List[bytes]:
+        if len(tx_datas) < threshold:
+            return [self.sign_sync(tx_data) for tx_data in tx_datas]
+
+        loop = asyncio.get_running_loop()
+        chunks = [tx_datas[i:i + chunk_size] for i in range(0, len(tx_datas), chunk_size)]
+        results = await asyncio.gather(*[
+            loop.run_in_executor(executor, lambda chunk=chunk: [self.sign_sync(tx_data) for tx_data in chunk])
+            for chunk in chunks
+        ])
+        return [signature for chunk in results for signature in chunk]
+
+    async def sign_and_execute(self, tx_bytes: StringAndBytes,
+                               request_type: str = ExecuteType.WaitForLocalExecution) -> Optional[dict]:
         signature = (await self.sign(tx_bytes.bytes_)).decode()
-        request_type = ExecuteType.WaitForLocalExecution
-        return await RPC.executeTransactionSerializedSig(
-            client=self, tx_bytes=tx_bytes.str_, signature=signature, request_type=request_type
-        )
+        try:
+            response = await RPC.executeTransactionSerializedSig(
+                client=self, tx_bytes=tx_bytes.str_, signature=signature, request_type=request_type
+            )
+
+        except:
+            if self.object_store:
+                self.object_store.invalidate()
+
+            raise
+
+        if self.object_store:
+            effects = await get_effects(response)
+            if effects:
+                await self.object_store.apply_effects(effects)
+
+            else:
+                digest = await get_digest(response)
+                if digest:
+                    self.confirmations.track(digest).add_done_callback(self._confirmed)
+
+                else:
+                    self.object_store.invalidate()
+
+        return response
+
+    def _confirmed(self, future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception():
+            self.object_store.invalidate()
+
+    async def submit(self, tx_bytes: StringAndBytes, request_type: str = ExecuteType.ImmediateReturn,
+                     timeout: Optional[float] = None) -> asyncio.Future:
+        response = await self.sign_and_execute(tx_bytes, request_type=request_type)
+        digest = await get_digest(response)
+        if not digest:
+            raise exceptions.TransactionException(f'No transaction digest in the response: {response}')
+
+        return self.confirmations.track(digest, timeout=timeout)
+
+    async def close(self) -> None:
+        await self.confirmations.close()
+        if self._own_transport:
+            await self.transport.close()
+
+    async def __aenter__(self) -> 'Client':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+from typing import Optional, Dict, List, Tuple, Set
+
+from pretty_utils.type_functions.lists import split_list
+
+from py_sui_async import exceptions
+from py_sui_async.rpc_methods import RPC
+
+
+class ConfirmationTracker:
+    def __init__(self, client, interval: float = 0.2, max_interval: float = 5, backoff: float = 1.5,
+                 batch_size: int = 100, timeout: Optional[float] = 120) -> None:
+        self.client = client
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.pending: Dict[str, Tuple[asyncio.Future, Optional[float]]] = {}
+        self.submitted: Set[str] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def track(self, digest: str, timeout: Optional[float] = None, submitted: bool = True) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        timeout = self.timeout if timeout is None else timeout
+        deadline = loop.time() + timeout if timeout else None
+        if submitted:
+            self.submitted.add(digest)
+
+        if digest in self.pending:
+            future, current = self.pending[digest]
+            if current is not None and (deadline is None or deadline > current):
+                self.pending[digest] = (future, deadline)
+
+            return future
+
+        future = loop.create_future()
+        self.pending[digest] = (future, deadline)
+        if not self._task or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+
+        self._wakeup.set()
+        return future
+
+    def untrack(self, digest: str) -> None:
+        self.submitted.discard(digest)
+        future, _ = self.pending.pop(digest, (None, None))
+        if future and not future.done():
+            future.cancel()
+
+    async def _resolve(self, digest: str, result: dict) -> None:
+        future, _ = self.pending.pop(digest, (None, None))
+        submitted = digest in self.submitted
+        self.submitted.discard(digest)
+        if submitted and self.client.object_store and result.get('effects'):
+            await self.client.object_store.apply_effects(result['effects'])
+
+        if future and not future.done():
+            future.set_result(result)
+
+    async def poll(self, digests: List[str]) -> int:
+        resolved = 0
+        for chunk in split_list(digests, self.batch_size):
+            json_data = [await RPC.getTransaction(client=self.client, digest=digest, get_json=True) for digest in
+                         chunk]
+            responses = await RPC.async_post(client=self.client, json_data=json_data)
+            responses = {response.get('id'): response for response in responses if isinstance(response, dict)}
+            for digest, request in zip(chunk, json_data):
+                result = (responses.get(request['id']) or {}).get('result')
+                if result and digest in self.pending:
+                    await self._resolve(digest, result)
+                    resolved += 1
+
+        return resolved
+
+    def _expire(self) -> None:
+        now = asyncio.get_running_loop().time()
+        for digest, (future, deadline) in list(self.pending.items()):
+            if future.done():
+                self.untrack(digest)
+
+            elif deadline and now >= deadline:
+                del self.pending[digest]
+                self.submitted.discard(digest)
+                future.set_exception(exceptions.TransactionException(f'Transaction {digest} was not confirmed'))
+
+    async def _run(self) -> None:
+        interval = self.interval
+        while self.pending:
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), interval)
+                await asyncio.sleep(self.interval)
+
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                resolved = await self.poll(list(self.pending))
+
+            except Exception:
+                logging.exception('confirmations')
+                resolved = 0
+
+            self._expire()
+            interval = self.interval if resolved else min(interval * self.backoff, self.max_interval)
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+
+            except asyncio.CancelledError:
+                pass
+
+        for digest in list(self.pending):
+            self.untrack(digest)
@@ -0,0 +1,343 @@
+import asyncio
+import json
+import logging
+import random
+from collections import OrderedDict
+from typing import Optional, List, Dict
+
+import aiohttp
+
+from py_sui_async import exceptions, types
+from py_sui_async.rpc_methods import RPC
+
+QUERY_BY_FILTER = {
+    'Sender': 'Sender', 'Recipient': 'Recipient', 'Object': 'Object', 'Transaction': 'Transaction',
+    'EventType': 'EventType', 'MoveEventType': 'MoveEvent'
+}
+
+
+def event_query(filter: types.EventFilter) -> Optional[types.EventQuery]:
+    if isinstance(filter, dict) and len(filter) == 1:
+        key, value = next(iter(filter.items()))
+        if key in QUERY_BY_FILTER:
+            return {QUERY_BY_FILTER[key]: value}
+
+
+def event_key(event: dict) -> Optional[tuple]:
+    event_id = event.get('id') if isinstance(event, dict) else None
+    if isinstance(event_id, dict):
+        return event_id.get('txSeq'), event_id.get('eventSeq')
+
+
+class Subscription:
+    def __init__(self, client, method: str, unsubscribe_method: str, params: list,
+                 query: Optional[types.EventQuery] = None, max_queue: int = 1000, page_size: int = 100) -> None:
+        self.client = client
+        self.method = method
+        self.unsubscribe_method = unsubscribe_method
+        self.params = params
+        self.query = query
+        self.page_size = page_size
+        self.queue: asyncio.Queue = asyncio.Queue(max_queue)
+        self.id: Optional[int] = None
+        self.last_event_id: Optional[types.EventID] = None
+        self.closed = False
+        self._manager: Optional[SubscriptionManager] = None
+        self._seen: OrderedDict = OrderedDict()
+        self._backlog: Optional[List[dict]] = None
+        self._overflowed = False
+
+    @property
+    def resumable(self) -> bool:
+        return self.query is not None and self.last_event_id is not None
+
+    async def start(self) -> None:
+        if not self._manager and not self.closed:
+            self._manager = self.client.transport.subscriptions(self.client)
+            await self._manager.add(self)
+
+    async def close(self) -> None:
+        if self.closed:
+            return
+
+        self.closed = True
+        if self._manager:
+            await self._manager.remove(self)
+
+        if self.queue.empty():
+            self.queue.put_nowait(None)
+
+    def _is_new(self, item: dict) -> bool:
+        key = event_key(item)
+        return key is None or key not in self._seen
+
+    def _delivered(self, item: dict) -> None:
+        key = event_key(item)
+        if key is not None:
+            self._seen[key] = True
+            if len(self._seen) > self.queue.maxsize + self.page_size:
+                self._seen.popitem(last=False)
+
+            self.last_event_id = item['id']
+
+    async def _deliver(self, item: dict) -> None:
+        if self._is_new(item):
+            await self.queue.put(item)
+            self._delivered(item)
+
+    def _overflow(self) -> None:
+        if self.resumable:
+            self._overflowed = True
+
+        elif not self.closed:
+            logging.warning(f'The subscription {self.id} fell behind and was closed')
+            asyncio.ensure_future(self.close())
+
+    def notify(self, item: dict) -> None:
+        if self.closed or self._overflowed:
+            return
+
+        if self._backlog is not None:
+            if len(self._backlog) < self.queue.maxsize:
+                self._backlog.append(item)
+
+            else:
+                self._overflow()
+
+            return
+
+        if not self._is_new(item):
+            return
+
+        try:
+            self.queue.put_nowait(item)
+            self._delivered(item)
+
+        except asyncio.QueueFull:
+            self._overflow()
+
+    async def catch_up(self) -> None:
+        try:
+            cursor = self.last_event_id
+            while cursor and not self.closed:
+                response = (await RPC.getEvents(client=self.client, query=self.query, cursor=cursor,
+                                                limit=self.page_size))['result']
+                for item in response['data']:
+                    await self._deliver(item)
+
+                if not response['data'] or response.get('nextCursor') in (None, cursor):
+                    break
+
+                cursor = response['nextCursor']
+
+        except Exception:
+            logging.exception('catch_up')
+
+        finally:
+            while self._backlog and not self.closed:
+                await self._deliver(self._backlog.pop(0))
+
+            if self._overflowed and not self.closed:
+                self._overflowed = False
+                self._backlog = []
+                asyncio.ensure_future(self.catch_up())
+
+            else:
+                self._backlog = None
+
+    def __aiter__(self) -> 'Subscription':
+        return self
+
+    async def __anext__(self) -> dict:
+        await self.start()
+        if self.closed and self.queue.empty():
+            raise StopAsyncIteration
+
+        item = await self.queue.get()
+        if item is None:
+            raise StopAsyncIteration
+
+        if self._overflowed and self._backlog is None and not self.closed:
+            self._overflowed = False
+            self._backlog = []
+            asyncio.ensure_future(self.catch_up())
+
+        return item
+
+    async def __aenter__(self) -> 'Subscription':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+
+class SubscriptionManager:
+    def __init__(self, client, request_timeout: float = 30, max_backoff: float = 30) -> None:
+        self.url = client.network.websocket
+        self.proxy = client.proxy
+        self.headers = {key: value for key, value in client.headers.items() if key != 'Content-type'}
+        self.transport = client.transport
+        self.request_timeout = request_timeout
+        self.max_backoff = max_backoff
+        self.subscriptions: List[Subscription] = []
+        self._by_id: Dict[int, Subscription] = {}
+        self._requests: Dict[str, asyncio.Future] = {}
+        self._subscribing: Dict[str, Subscription] = {}
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._connected: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def request(self, method: str, params: list, subscription: Optional[Subscription] = None):
+        await self._connected.wait()
+        json_data = await RPC.make_json(method=method, params=params)
+        future = asyncio.get_running_loop().create_future()
+        self._requests[json_data['id']] = future
+        if subscription:
+            self._subscribing[json_data['id']] = subscription
+
+        try:
+            await self._ws.send_json(json_data)
+            response = await asyncio.wait_for(future, self.request_timeout)
+
+        finally:
+            self._requests.pop(json_data['id'], None)
+            self._subscribing.pop(json_data['id'], None)
+
+        if 'error' in response:
+            error = response['error']
+            raise exceptions.RPCException(code=error['code'], message=error['message'])
+
+        return response['result']
+
+    async def _subscribe(self, subscription: Subscription) -> None:
+        resume = subscription.resumable and subscription._backlog is None
+        if resume:
+            subscription._backlog = []
+
+        await self.request(subscription.method, subscription.params, subscription)
+        if resume:
+            asyncio.ensure_future(subscription.catch_up())
+
+    async def add(self, subscription: Subscription) -> None:
+        if not self.url:
+            raise exceptions.ClientException("You didn't specify the websocket URL!")
+
+        self.subscriptions.append(subscription)
+        if not self._task or self._task.done():
+            self._connected = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+
+        elif self._connected.is_set():
+            await self._subscribe(subscription)
+
+    async def remove(self, subscription: Subscription) -> None:
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+
+        if self._by_id.pop(subscription.id, None) is not None and self._ws and not self._ws.closed:
+            try:
+                await self.request(subscription.unsubscribe_method, [subscription.id])
+
+            except Exception:
+                pass
+
+        if not self.subscriptions:
+            await self.close()
+
+    async def _resubscribe(self) -> None:
+        self._by_id = {}
+        for subscription in list(self.subscriptions):
+            try:
+                await self._subscribe(subscription)
+
+            except Exception:
+                logging.exception('resubscribe')
+                await self._ws.close()
+                return
+
+    async def _dispatch(self, message: dict) -> None:
+        if 'id' in message and message['id'] in self._requests:
+            subscription = self._subscribing.get(message['id'])
+            if subscription and 'result' in message:
+                subscription.id = message['result']
+                self._by_id[subscription.id] = subscription
+
+            future = self._requests[message['id']]
+            if not future.done():
+                future.set_result(message)
+
+            return
+
+        params = message.get('params')
+        if isinstance(params, dict):
+            subscription = self._by_id.get(params.get('subscription'))
+            if subscription:
+                subscription.notify(params.get('result'))
+
+    async def _run(self) -> None:
+        attempt = 0
+        while self.subscriptions:
+            resubscribe = None
+            try:
+                session = await self.transport.get_session()
+                async with session.ws_connect(self.url, proxy=self.proxy, headers=self.headers,
+                                              heartbeat=30) as ws:
+                    self._ws = ws
+                    self._connected.set()
+                    resubscribe = asyncio.ensure_future(self._resubscribe())
+                    async for message in ws:
+                        if message.type == aiohttp.WSMsgType.TEXT:
+                            attempt = 0
+                            await self._dispatch(json.loads(message.data))
+
+                        elif message.type == aiohttp.WSMsgType.ERROR:
+                            break
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                logging.exception('subscriptions')
+
+            finally:
+                self._connected.clear()
+                self._ws = None
+                if resubscribe:
+                    resubscribe.cancel()
+
+                for future in self._requests.values():
+                    if not future.done():
+                        future.set_exception(exceptions.ClientException('The websocket connection was closed'))
+
+            if self.subscriptions:
+                await asyncio.sleep(random.uniform(0, min(self.max_backoff, 0.5 * 2 ** attempt)))
+                attempt += 1
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+
+            except asyncio.CancelledError:
+                pass
+
+        for subscription in list(self.subscriptions):
+            subscription.closed = True
+            if subscription.queue.empty():
+                subscription.queue.put_nowait(None)
+
+        self.subscriptions = []
+
+
+class Events:
+    def __init__(self, client):
+        self.client = client
+
+    def subscribe(self, filter: types.EventFilter, query: Optional[types.EventQuery] = None,
+                  max_queue: int = 1000) -> Subscription:
+        return Subscription(client=self.client, method='sui_subscribeEvent', unsubscribe_method='sui_unsubscribeEvent',
+                            params=[filter], query=query or event_query(filter), max_queue=max_queue)
+
+    def subscribe_transactions(self, filter: dict, max_queue: int = 1000) -> Subscription:
+        return Subscription(client=self.client, method='sui_subscribeTransaction',
+                            unsubscribe_method='sui_unsubscribeTransaction', params=[filter], max_queue=max_queue)
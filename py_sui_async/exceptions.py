@@ -18,6 +18,24 @@ class RPCException(ClientException):
         self.code = code
         self.message = message
 
+    @property
+    def status(self) -> Optional[int]:
+        if self.response is not None:
+            return self.response.status
+
+    @property
+    def retry_after(self) -> Optional[float]:
+        if self.response is not None:
+            try:
+                return float(self.response.headers.get('Retry-After'))
+
+            except (TypeError, ValueError):
+                pass
+
+    @property
+    def oversized(self) -> bool:
+        return self.status == 413 or self.code in (-32007, -32010)
+
     def __str__(self):
         if self.code:
             return f'{self.code}, {self.message}'
@@ -25,6 +43,19 @@ class RPCException(ClientException):
         return f'{self.response.status}'
 
 
+class CircuitOpen(RPCException):
+    def __init__(self, url: str, reopens_in: Optional[float] = None) -> None:
+        super().__init__(message=f'All endpoints are failing, the last one tried was {url}')
+        self.reopens_in = reopens_in
+
+    @property
+    def retry_after(self) -> Optional[float]:
+        return self.reopens_in
+
+    def __str__(self):
+        return self.message
+
+
 class NFTException(Exception):
     pass
 
@@ -0,0 +1,57 @@
+import asyncio
+import time
+from typing import Optional, Dict
+
+from py_sui_async.rpc_methods import RPC
+
+
+class GasPriceCache:
+    _caches: Dict[str, 'GasPriceCache'] = {}
+
+    def __init__(self, ttl: float = 60) -> None:
+        self.ttl = ttl
+        self.epoch: Optional[int] = None
+        self.price: Optional[int] = None
+        self.expires: float = 0.0
+        self._refresh: Optional[asyncio.Future] = None
+
+    @classmethod
+    def for_network(cls, network) -> 'GasPriceCache':
+        if network.rpc not in cls._caches:
+            cls._caches[network.rpc] = cls()
+
+        return cls._caches[network.rpc]
+
+    async def get(self, client) -> int:
+        if self.price is not None and time.time() < self.expires:
+            return self.price
+
+        loop = asyncio.get_running_loop()
+        if not self._refresh or self._refresh.done() or self._refresh.get_loop() is not loop:
+            self._refresh = asyncio.ensure_future(self._fetch(client))
+
+        return await asyncio.shield(self._refresh)
+
+    def invalidate(self) -> None:
+        self.expires = 0.0
+
+    async def _fetch(self, client) -> int:
+        state = (await RPC.getSuiSystemState(client=client))['result']
+        epoch = int(state['epoch'])
+        if epoch != self.epoch or self.price is None:
+            price = state.get('reference_gas_price')
+            if price is None:
+                price = (await RPC.getReferenceGasPrice(client=client))['result']
+
+            self.epoch = epoch
+            self.price = int(price)
+
+        now = time.time()
+        self.expires = now + self.ttl
+        epoch_duration = state.get('epoch_duration_ms') or state.get('parameters', {}).get('epoch_duration_ms')
+        if epoch_duration and state.get('epoch_start_timestamp_ms'):
+            epoch_end = (int(state['epoch_start_timestamp_ms']) + int(epoch_duration)) / 1000
+            if epoch_end > now:
+                self.expires = epoch_end
+
+        return self.price
@@ -0,0 +1,64 @@
+import json
+import sqlite3
+from typing import Optional, List
+
+from py_sui_async.models import Tx
+
+DIRECTIONS = ('incoming', 'outgoing')
+
+
+class HistoryStore:
+    def __init__(self, path: str = ':memory:') -> None:
+        self.path = path
+        self._db = sqlite3.connect(self.path)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS cursors (address TEXT NOT NULL, direction TEXT NOT NULL, '
+            'last_digest TEXT NOT NULL, PRIMARY KEY (address, direction))'
+        )
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS transactions (id INTEGER PRIMARY KEY AUTOINCREMENT, address TEXT NOT NULL, '
+            'direction TEXT NOT NULL, digest TEXT NOT NULL, status TEXT, timestamp INTEGER, sender TEXT, '
+            'recipients TEXT, transactions TEXT, raw TEXT, UNIQUE (address, direction, digest))'
+        )
+        self._db.commit()
+
+    def last_digest(self, address: str, direction: str) -> Optional[str]:
+        row = self._db.execute('SELECT last_digest FROM cursors WHERE address = ? AND direction = ?',
+                               (address, direction)).fetchone()
+        return row[0] if row else None
+
+    def add(self, address: str, direction: str, txs: List[Tx]) -> None:
+        if not txs:
+            return
+
+        self._db.executemany(
+            'INSERT OR REPLACE INTO transactions (address, direction, digest, status, timestamp, sender, recipients, '
+            'transactions, raw) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [(address, direction, tx.digest, tx.status, tx.timestamp, tx.sender, json.dumps(tx.recipients),
+              json.dumps(tx.transactions), json.dumps(tx.raw_dict) if tx.raw_dict is not None else None) for tx in
+             reversed(txs)]
+        )
+        self._db.execute('INSERT OR REPLACE INTO cursors (address, direction, last_digest) VALUES (?, ?, ?)',
+                         (address, direction, txs[0].digest))
+        self._db.commit()
+
+    def get(self, address: str, direction: str) -> List[Tx]:
+        rows = self._db.execute(
+            'SELECT digest, status, timestamp, sender, recipients, transactions, raw FROM transactions '
+            'WHERE address = ? AND direction = ? ORDER BY id DESC', (address, direction)
+        ).fetchall()
+        return [Tx(digest=digest, status=status, timestamp=timestamp, sender=sender, recipients=json.loads(recipients),
+                   transactions=json.loads(transactions), raw_dict=json.loads(raw) if raw is not None else None,
+                   direction=direction) for digest, status, timestamp, sender, recipients, transactions, raw in rows]
+
+    def clear(self, address: str, direction: Optional[str] = None) -> None:
+        for direction in [direction] if direction else DIRECTIONS:
+            self._db.execute('DELETE FROM transactions WHERE address = ? AND direction = ?', (address, direction))
+            self._db.execute('DELETE FROM cursors WHERE address = ? AND direction = ?', (address, direction))
+
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,161 @@
+import asyncio
+import base64
+import hashlib
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional, List, Dict
+
+import nacl.pwhash
+import nacl.secret
+import nacl.utils
+
+from py_sui_async.models import WalletInfo, StringAndBytes
+
+DEFAULT_DERIVATION_PATH = "m/44'/784'/0'/0'/0'"
+INDEX_DERIVATION_PATH = "m/44'/784'/{}'/0'/0'"
+
+
+def generate_mnemonic() -> str:
+    import bip_utils
+
+    return bip_utils.Bip39MnemonicGenerator().FromWordsNumber(bip_utils.Bip39WordsNum.WORDS_NUM_12).ToStr()
+
+
+def mnemonic_to_seed(mnemonic: str) -> bytes:
+    import bip_utils
+
+    return bytes(bip_utils.Bip39SeedGenerator(mnemonic).Generate())
+
+
+def derive_from_seed(seed: bytes, mnemonic: str, derivation_path: str = DEFAULT_DERIVATION_PATH) -> WalletInfo:
+    import bip_utils
+
+    bip32_der_ctx = bip_utils.Bip32Slip10Ed25519.FromSeed(seed).DerivePath(derivation_path)
+    private_key = bip32_der_ctx.PrivateKey().Raw()
+    private_key = StringAndBytes(str_="0x" + str(private_key), bytes_=private_key.ToBytes())
+    public_key = bip32_der_ctx.PublicKey().RawCompressed()
+    public_key = StringAndBytes(str_="0x" + str(public_key), bytes_=public_key.ToBytes())
+    pub_key_bytes = public_key.bytes_
+    address = "0x" + hashlib.blake2b(
+        pub_key_bytes[0:33] if pub_key_bytes[0] == 0 else pub_key_bytes[0:34], digest_size=32
+    ).hexdigest()
+    return WalletInfo(mnemonic=mnemonic, private_key=private_key, public_key=public_key, address=address)
+
+
+def derive_account(mnemonic: str, derivation_path: str = DEFAULT_DERIVATION_PATH) -> WalletInfo:
+    return derive_from_seed(seed=mnemonic_to_seed(mnemonic), mnemonic=mnemonic, derivation_path=derivation_path)
+
+
+def derive_indexes(mnemonic: str, indexes: List[int], path_template: str = INDEX_DERIVATION_PATH) -> List[WalletInfo]:
+    seed = mnemonic_to_seed(mnemonic)
+    return [derive_from_seed(seed=seed, mnemonic=mnemonic, derivation_path=path_template.format(index)) for index in
+            indexes]
+
+
+def _derive_accounts_chunk(mnemonics: List[str], derivation_path: str) -> List[WalletInfo]:
+    return [derive_account(mnemonic=mnemonic, derivation_path=derivation_path) for mnemonic in mnemonics]
+
+
+def derive_accounts(mnemonics: List[str], derivation_path: str = DEFAULT_DERIVATION_PATH,
+                    processes: Optional[int] = None, chunk_size: int = 64,
+                    keystore: Optional['Keystore'] = None) -> List[WalletInfo]:
+    accounts: Dict[int, WalletInfo] = {}
+    missing = []
+    for i, mnemonic in enumerate(mnemonics):
+        account = keystore.get(mnemonic, derivation_path) if keystore else None
+        if account:
+            accounts[i] = account
+
+        else:
+            missing.append(i)
+
+    if missing:
+        chunks = [missing[i:i + chunk_size] for i in range(0, len(missing), chunk_size)]
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = executor.map(_derive_accounts_chunk, [[mnemonics[i] for i in chunk] for chunk in chunks],
+                                   [derivation_path] * len(chunks))
+            for chunk, chunk_accounts in zip(chunks, results):
+                for i, account in zip(chunk, chunk_accounts):
+                    accounts[i] = account
+
+        if keystore:
+            for i in missing:
+                keystore.put(accounts[i], derivation_path)
+
+            keystore.save()
+
+    return [accounts[i] for i in range(len(mnemonics))]
+
+
+async def async_derive_account(mnemonic: str, derivation_path: str = DEFAULT_DERIVATION_PATH,
+                               executor: Optional[Executor] = None) -> WalletInfo:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, derive_account, mnemonic, derivation_path)
+
+
+async def async_derive_accounts(mnemonics: List[str], derivation_path: str = DEFAULT_DERIVATION_PATH,
+                                processes: Optional[int] = None, chunk_size: int = 64,
+                                keystore: Optional['Keystore'] = None) -> List[WalletInfo]:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, lambda: derive_accounts(
+        mnemonics=mnemonics, derivation_path=derivation_path, processes=processes, chunk_size=chunk_size,
+        keystore=keystore
+    ))
+
+
+class Keystore:
+    def __init__(self, path: str, password: str) -> None:
+        self.path = path
+        self.password = password.encode()
+        self.accounts: Dict[str, dict] = {}
+        self.salt = nacl.utils.random(nacl.pwhash.argon2id.SALTBYTES)
+        self._box: Optional[nacl.secret.SecretBox] = None
+        if os.path.exists(self.path):
+            self.load()
+
+    @property
+    def box(self) -> nacl.secret.SecretBox:
+        if not self._box:
+            key = nacl.pwhash.argon2id.kdf(nacl.secret.SecretBox.KEY_SIZE, self.password, self.salt,
+                                           opslimit=nacl.pwhash.argon2id.OPSLIMIT_INTERACTIVE,
+                                           memlimit=nacl.pwhash.argon2id.MEMLIMIT_INTERACTIVE)
+            self._box = nacl.secret.SecretBox(key)
+
+        return self._box
+
+    @staticmethod
+    def _key(mnemonic: str, derivation_path: str) -> str:
+        return hashlib.blake2b(f'{derivation_path}|{mnemonic}'.encode(), digest_size=32).hexdigest()
+
+    def load(self) -> None:
+        with open(self.path) as file:
+            data = json.load(file)
+
+        self.salt = base64.b64decode(data['salt'])
+        self._box = None
+        self.accounts = json.loads(self.box.decrypt(base64.b64decode(data['data'])))
+
+    def save(self) -> None:
+        data = {
+            'salt': base64.b64encode(self.salt).decode(),
+            'data': base64.b64encode(self.box.encrypt(json.dumps(self.accounts).encode())).decode()
+        }
+        with open(self.path, 'w') as file:
+            json.dump(data, file)
+
+    def get(self, mnemonic: str, derivation_path: str = DEFAULT_DERIVATION_PATH) -> Optional[WalletInfo]:
+        account = self.accounts.get(self._key(mnemonic, derivation_path))
+        if account:
+            private_key = bytes.fromhex(account['private_key'])
+            public_key = bytes.fromhex(account['public_key'])
+            return WalletInfo(mnemonic=mnemonic,
+                              private_key=StringAndBytes(str_='0x' + private_key.hex(), bytes_=private_key),
+                              public_key=StringAndBytes(str_='0x' + public_key.hex(), bytes_=public_key),
+                              address=account['address'])
+
+    def put(self, account: WalletInfo, derivation_path: str = DEFAULT_DERIVATION_PATH) -> None:
+        self.accounts[self._key(account.mnemonic, derivation_path)] = {
+            'private_key': account.private_key.bytes_.hex(), 'public_key': account.public_key.bytes_.hex(),
+            'address': account.address
+        }
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Union
+from typing import Optional, List, Dict, Union, Any
 
 from pretty_utils.type_functions.classes import AutoRepr
 
@@ -16,19 +16,33 @@ class ExecuteType:
     WaitForLocalExecution = 'WaitForLocalExecution'
 
 
+@dataclass
+class Endpoint:
+    url: str
+    weight: float = 1.0
+    rate_limit: Optional[float] = None
+
+
 @dataclass
 class Network:
     rpc: str
     explorer: Optional[str] = None
     faucet: Optional[str] = None
+    endpoints: Optional[List[Endpoint]] = None
+    websocket: Optional[str] = None
+
+    @property
+    def all_endpoints(self) -> List[Endpoint]:
+        return self.endpoints or [Endpoint(url=self.rpc)]
 
 
 class Networks:
     Devnet = Network(rpc='https://fullnode.devnet.sui.io/', explorer='https://explorer.sui.io/{}?network=devnet',
-                     faucet='https://faucet.devnet.sui.io/gas')
-    Staging = Network(rpc='https://fullnode.staging.sui.io/', faucet='https://faucet.staging.sui.io/gas')
+                     faucet='https://faucet.devnet.sui.io/gas', websocket='wss://fullnode.devnet.sui.io/')
+    Staging = Network(rpc='https://fullnode.staging.sui.io/', faucet='https://faucet.staging.sui.io/gas',
+                      websocket='wss://fullnode.staging.sui.io/')
     Testnet = Network(rpc='https://fullnode.testnet.sui.io/', explorer='https://explorer.sui.io/{}?network=testnet',
-                      faucet='https://faucet.testnet.sui.io/gas')
+                      faucet='https://faucet.testnet.sui.io/gas', websocket='wss://fullnode.testnet.sui.io/')
 
 
 @dataclass
@@ -45,6 +59,16 @@ class WalletInfo:
     address: str
 
 
+@dataclass
+class OwnedObject:
+    object_id: str
+    version: Optional[int] = None
+    digest: Optional[str] = None
+    type: Optional[str] = None
+    coin_type: Optional[str] = None
+    balance: Optional[int] = None
+
+
 @dataclass
 class Tx:
     digest: str
@@ -53,7 +77,8 @@ class Tx:
     sender: str
     recipients: Optional[List[str]]
     transactions: List[dict]
-    raw_dict: dict
+    raw_dict: Optional[dict]
+    direction: Optional[str] = None
 
 
 @dataclass
@@ -63,9 +88,12 @@ class History:
 
 
 class ObjectID(AutoRepr):
-    def __init__(self, id: str, amount: Union[int, str]) -> None:
+    def __init__(self, id: str, amount: Union[int, str], version: Optional[int] = None,
+                 digest: Optional[str] = None) -> None:
         self.id: str = id
         self.amount: int = int(amount)
+        self.version: Optional[int] = version
+        self.digest: Optional[str] = digest
 
 
 class Coin(AutoRepr):
@@ -109,3 +137,10 @@ class Balance:
     tokens: Optional[Dict[str, Coin]] = None
     nfts: Optional[Dict[str, Nft]] = None
     misc: Optional[Dict[str, dict]] = None
+
+
+@dataclass
+class PoolResult:
+    client: Any
+    result: Any = None
+    exception: Optional[BaseException] = None
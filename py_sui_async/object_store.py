@@ -0,0 +1,164 @@
+import asyncio
+import logging
+from typing import Optional, Dict, List
+
+from py_sui_async.models import Balance, OwnedObject, ObjectID
+from py_sui_async.pagination import iter_all_coins
+from py_sui_async.rpc_methods import RPC
+from py_sui_async.utils import parse_type, parse_coin_type, add_coin
+
+
+class ObjectStore:
+    def __init__(self, client):
+        self.client = client
+        self.objects: Dict[str, OwnedObject] = {}
+        self.loaded = False
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        if not self._lock:
+            self._lock = asyncio.Lock()
+
+        return self._lock
+
+    def invalidate(self) -> None:
+        self.loaded = False
+
+    def coins(self, coin_type: str = '0x2::sui::SUI') -> List[OwnedObject]:
+        return [obj for obj in self.objects.values() if obj.coin_type == coin_type and obj.balance is not None]
+
+    async def refresh(self) -> None:
+        address = self.client.account.address
+        objects = {}
+        async for coin in iter_all_coins(client=self.client, owner=address):
+            objects[coin['coinObjectId']] = OwnedObject(
+                object_id=coin['coinObjectId'], version=coin.get('version'), digest=coin.get('digest'),
+                coin_type=coin['coinType'], balance=int(coin['balance'])
+            )
+
+        for obj in (await RPC.getObjectsOwnedByAddress(client=self.client, address=address))['result']:
+            if obj['objectId'] in objects:
+                objects[obj['objectId']].type = obj.get('type')
+
+            else:
+                objects[obj['objectId']] = OwnedObject(object_id=obj['objectId'], version=obj.get('version'),
+                                                       digest=obj.get('digest'), type=obj.get('type'))
+
+        self.objects = objects
+        self.loaded = True
+
+    async def _refresh_stale(self) -> None:
+        stale = [obj.object_id for obj in self.objects.values() if obj.type is None and obj.coin_type is None or
+                 obj.coin_type is not None and obj.balance is None]
+        if not stale:
+            return
+
+        json_data = [await RPC.getObject(client=self.client, object_id=object_id, get_json=True) for object_id in stale]
+        for response in await RPC.async_post(client=self.client, json_data=json_data):
+            details = response['result']['details']
+            obj = self.objects[details['reference']['objectId']]
+            obj.version = details['reference'].get('version')
+            obj.digest = details['reference'].get('digest')
+            obj.type = details['data']['type']
+            obj_type = await parse_type(obj.type)
+            if obj_type.module == 'coin' and obj_type.structure and not isinstance(obj_type.structure, str):
+                obj.coin_type = obj.type[obj.type.index('<') + 1:-1]
+                obj.balance = int(details['data']['fields']['balance'])
+
+    async def sync(self) -> None:
+        async with self.lock:
+            try:
+                if self.loaded:
+                    await self._refresh_stale()
+
+            except:
+                logging.exception('object_store')
+                self.loaded = False
+
+            if not self.loaded:
+                await self.refresh()
+
+    async def balance(self) -> Balance:
+        await self.sync()
+        balance = Balance(tokens={}, nfts={}, misc={})
+        for obj in self.objects.values():
+            if obj.coin_type is not None and obj.balance is not None:
+                obj_id = ObjectID(id=obj.object_id, amount=obj.balance, version=obj.version, digest=obj.digest)
+                await add_coin(balance=balance, coin_type=await parse_coin_type(obj.coin_type), obj_id=obj_id)
+
+        return balance
+
+    def _is_current(self, reference: dict) -> bool:
+        obj = self.objects.get(reference['objectId'])
+        if not obj or obj.version is None or reference.get('version') is None:
+            return False
+
+        return int(obj.version) >= int(reference['version'])
+
+    async def apply_effects(self, effects: Optional[dict]) -> None:
+        if not effects:
+            self.invalidate()
+            return
+
+        address = self.client.account.address
+        created = set()
+        unknown = set()
+        applied = set()
+        for key in ('created', 'mutated', 'unwrapped'):
+            for entry in effects.get(key) or []:
+                reference = entry['reference']
+                object_id = reference['objectId']
+                if self._is_current(reference):
+                    continue
+
+                applied.add(object_id)
+                owner = entry.get('owner')
+                if not isinstance(owner, dict) or owner.get('AddressOwner') != address:
+                    self.objects.pop(object_id, None)
+                    continue
+
+                obj = self.objects.get(object_id)
+                if not obj or key != 'mutated':
+                    obj = OwnedObject(object_id=object_id)
+                    self.objects[object_id] = obj
+                    (unknown if key == 'mutated' else created).add(object_id)
+
+                obj.version = reference.get('version')
+                obj.digest = reference.get('digest')
+
+        for key in ('deleted', 'wrapped'):
+            for reference in effects.get(key) or []:
+                if not self._is_current(reference):
+                    self.objects.pop(reference['objectId'], None)
+
+        balance_changes = [event['coinBalanceChange'] for event in effects.get('events') or [] if
+                           'coinBalanceChange' in event]
+        if not balance_changes:
+            for entry in effects.get('mutated') or []:
+                obj = self.objects.get(entry['reference']['objectId'])
+                if obj and obj.object_id in applied and obj.coin_type is not None:
+                    obj.balance = None
+
+            return
+
+        changed = set()
+        for change in balance_changes:
+            owner = change.get('owner')
+            if not isinstance(owner, dict) or owner.get('AddressOwner') != address:
+                continue
+
+            obj = self.objects.get(change['coinObjectId'])
+            if not obj or obj.object_id in unknown or obj.object_id not in applied:
+                continue
+
+            if obj.object_id in created and obj.object_id not in changed:
+                obj.balance = 0
+
+            changed.add(obj.object_id)
+            if obj.balance is None:
+                continue
+
+            obj.coin_type = change['coinType']
+            obj.type = f'0x2::coin::Coin<{obj.coin_type}>'
+            obj.balance += int(change['amount'])
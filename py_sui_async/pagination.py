@@ -0,0 +1,101 @@
+import asyncio
+from typing import Optional, Any, Callable, Awaitable, AsyncIterator, Union
+
+from py_sui_async import types
+from py_sui_async.models import ObjectType
+from py_sui_async.rpc_methods import RPC
+
+
+async def paginate(fetch: Callable[[Any, Optional[int]], Awaitable[dict]], cursor: Any = None,
+                   page_size: Optional[int] = None, max_items: Optional[int] = None,
+                   prefetch: bool = True) -> AsyncIterator[Any]:
+    remaining = max_items
+
+    def limit() -> Optional[int]:
+        if remaining is None:
+            return page_size
+
+        return min(page_size, remaining) if page_size else remaining
+
+    if remaining is not None and remaining <= 0:
+        return
+
+    task = asyncio.ensure_future(fetch(cursor, limit()))
+    try:
+        while task:
+            page = (await task)['result']
+            task = None
+            data = page['data']
+            if remaining is not None:
+                data = data[:remaining]
+                remaining -= len(data)
+
+            next_cursor = page.get('nextCursor')
+            more = data and next_cursor is not None and next_cursor != cursor and (remaining is None or remaining > 0)
+            if more:
+                cursor = next_cursor
+                if prefetch:
+                    task = asyncio.ensure_future(fetch(cursor, limit()))
+
+            for item in data:
+                yield item
+
+            if more and not prefetch:
+                task = asyncio.ensure_future(fetch(cursor, limit()))
+
+    finally:
+        if task:
+            if task.done():
+                if not task.cancelled():
+                    task.exception()
+
+            else:
+                task.cancel()
+
+
+def iter_events(client, query: types.EventQuery, cursor: Optional[types.EventID] = None,
+                page_size: Optional[int] = None, max_items: Optional[int] = None, descending_order: bool = False,
+                prefetch: bool = True) -> AsyncIterator[dict]:
+    async def fetch(cursor: Optional[types.EventID], limit: Optional[int]) -> dict:
+        return await RPC.getEvents(client=client, query=query, cursor=cursor, limit=limit,
+                                   descending_order=descending_order)
+
+    return paginate(fetch, cursor=cursor, page_size=page_size, max_items=max_items, prefetch=prefetch)
+
+
+def iter_transactions(client, query: types.TransactionQuery, cursor: Optional[types.TransactionDigest] = None,
+                      page_size: Optional[int] = None, max_items: Optional[int] = None,
+                      descending_order: bool = False, prefetch: bool = True) -> AsyncIterator[str]:
+    async def fetch(cursor: Optional[types.TransactionDigest], limit: Optional[int]) -> dict:
+        return await RPC.getTransactions(client=client, query=query, cursor=cursor, limit=limit,
+                                         descending_order=descending_order)
+
+    return paginate(fetch, cursor=cursor, page_size=page_size, max_items=max_items, prefetch=prefetch)
+
+
+def iter_coins(client, owner: types.SuiAddress, coin_type: Union[str, ObjectType],
+               cursor: Optional[types.ObjectID] = None, page_size: Optional[int] = None,
+               max_items: Optional[int] = None, prefetch: bool = True) -> AsyncIterator[dict]:
+    async def fetch(cursor: Optional[types.ObjectID], limit: Optional[int]) -> dict:
+        return await RPC.getCoins(client=client, owner=owner, coin_type=coin_type, cursor=cursor, limit=limit)
+
+    return paginate(fetch, cursor=cursor, page_size=page_size, max_items=max_items, prefetch=prefetch)
+
+
+def iter_all_coins(client, owner: types.SuiAddress, cursor: Optional[types.ObjectID] = None,
+                   page_size: Optional[int] = None, max_items: Optional[int] = None,
+                   prefetch: bool = True) -> AsyncIterator[dict]:
+    async def fetch(cursor: Optional[types.ObjectID], limit: Optional[int]) -> dict:
+        return await RPC.getAllCoins(client=client, owner=owner, cursor=cursor, limit=limit)
+
+    return paginate(fetch, cursor=cursor, page_size=page_size, max_items=max_items, prefetch=prefetch)
+
+
+def iter_dynamic_fields(client, parent_object_id: types.ObjectID, cursor: Optional[types.ObjectID] = None,
+                        page_size: Optional[int] = None, max_items: Optional[int] = None,
+                        prefetch: bool = True) -> AsyncIterator[dict]:
+    async def fetch(cursor: Optional[types.ObjectID], limit: Optional[int]) -> dict:
+        return await RPC.getDynamicFields(client=client, parent_object_id=parent_object_id, cursor=cursor,
+                                          limit=limit)
+
+    return paginate(fetch, cursor=cursor, page_size=page_size, max_items=max_items, prefetch=prefetch)
@@ -0,0 +1,103 @@
+import asyncio
+from typing import Optional, List, Dict, Callable, Awaitable, AsyncIterator
+
+from py_sui_async import keys
+from py_sui_async.batcher import Batcher
+from py_sui_async.client import Client
+from py_sui_async.models import Network, Networks, PoolResult, WalletInfo
+from py_sui_async.transport import Transport
+
+
+class ClientPool:
+    def __init__(self, mnemonics: List[str], network: Network = Networks.Testnet,
+                 proxies: Optional[List[str]] = None, concurrency: int = 100, per_endpoint: int = 50,
+                 transport: Optional[Transport] = None, batcher: Optional[Batcher] = None,
+                 accounts: Optional[List[WalletInfo]] = None, **client_kwargs) -> None:
+        self.network = network
+        self.concurrency = concurrency
+        self.per_endpoint = per_endpoint
+        self._own_transport = transport is None
+        self.transport = transport or Transport(limit=concurrency, limit_per_host=per_endpoint)
+        self.batcher = batcher
+        self.clients: List[Client] = []
+        for i, mnemonic in enumerate(mnemonics):
+            proxy = proxies[i % len(proxies)] if proxies else None
+            account = accounts[i] if accounts else None
+            self.clients.append(Client(mnemonic, network=network, proxy=proxy, transport=self.transport,
+                                       batcher=self.batcher, account=account, **client_kwargs))
+
+        self._network_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> 'ClientPool':
+        return cls(cls.read_mnemonics(path), **kwargs)
+
+    @staticmethod
+    def read_mnemonics(path: str) -> List[str]:
+        with open(path) as file:
+            return [line.strip() for line in file if line.strip() and not line.strip().startswith('#')]
+
+    @classmethod
+    async def create(cls, mnemonics: List[str], derivation_path: str = keys.DEFAULT_DERIVATION_PATH,
+                     processes: Optional[int] = None, keystore: Optional[keys.Keystore] = None,
+                     **kwargs) -> 'ClientPool':
+        accounts = await keys.async_derive_accounts(mnemonics=mnemonics, derivation_path=derivation_path,
+                                                    processes=processes, keystore=keystore)
+        check_proxy = kwargs.pop('check_proxy', True)
+        pool = cls(mnemonics, derivation_path=derivation_path, accounts=accounts, check_proxy=False, **kwargs)
+        if check_proxy and kwargs.get('proxies'):
+            try:
+                await asyncio.gather(*[client.check_proxy() for client in pool.clients])
+
+            except:
+                await pool.close()
+                raise
+
+        return pool
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def _network_semaphore(self, client: Client) -> asyncio.Semaphore:
+        if client.network.rpc not in self._network_semaphores:
+            self._network_semaphores[client.network.rpc] = asyncio.Semaphore(
+                self.per_endpoint * len(client.network.all_endpoints)
+            )
+
+        return self._network_semaphores[client.network.rpc]
+
+    async def _run_one(self, client: Client, func: Callable[[Client], Awaitable],
+                       semaphore: asyncio.Semaphore) -> PoolResult:
+        async with semaphore:
+            async with self._network_semaphore(client):
+                try:
+                    return PoolResult(client=client, result=await func(client))
+
+                except Exception as e:
+                    return PoolResult(client=client, exception=e)
+
+    async def run(self, func: Callable[[Client], Awaitable],
+                  clients: Optional[List[Client]] = None) -> AsyncIterator[PoolResult]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [asyncio.ensure_future(self._run_one(client=client, func=func, semaphore=semaphore)) for client in
+                 clients or self.clients]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def close(self) -> None:
+        for client in self.clients:
+            await client.close()
+
+        if self._own_transport:
+            await self.transport.close()
+
+    async def __aenter__(self) -> 'ClientPool':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -0,0 +1,118 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional, List, Set, AsyncIterator
+
+from py_sui_async import exceptions
+from py_sui_async.models import OwnedObject
+
+SUI_COIN_TYPE = '0x2::sui::SUI'
+
+
+class CoinReservations:
+    def __init__(self, client, timeout: float = 30) -> None:
+        self.client = client
+        self.timeout = timeout
+        self.leased: Set[str] = set()
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def condition(self) -> asyncio.Condition:
+        if not self._condition:
+            self._condition = asyncio.Condition()
+
+        return self._condition
+
+    @staticmethod
+    def _select(coins: List[OwnedObject], amount: int, single: bool) -> Optional[List[OwnedObject]]:
+        if single:
+            for coin in sorted(coins, key=lambda coin: coin.balance):
+                if coin.balance >= amount:
+                    return [coin]
+
+            return None
+
+        selected = []
+        total = 0
+        for coin in sorted(coins, key=lambda coin: coin.balance, reverse=True):
+            selected.append(coin)
+            total += coin.balance
+            if total >= amount:
+                return selected
+
+        return None
+
+    async def acquire(self, amount: int, coin_type: str = SUI_COIN_TYPE, single: bool = True,
+                      excluding: Optional[List[str]] = None, prefer: Optional[Set[str]] = None,
+                      timeout: Optional[float] = None) -> List[OwnedObject]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (self.timeout if timeout is None else timeout)
+        excluding = set(excluding or [])
+        async with self.condition:
+            while True:
+                await self.client.object_store.sync()
+                coins = [coin for coin in self.client.object_store.coins(coin_type) if
+                         coin.object_id not in excluding]
+                free = [coin for coin in coins if coin.object_id not in self.leased]
+                selected = None
+                if prefer:
+                    selected = self._select([coin for coin in free if coin.object_id in prefer], amount, single)
+
+                selected = selected or self._select(free, amount, single)
+                if selected:
+                    self.leased.update(coin.object_id for coin in selected)
+                    return selected
+
+                if not self._select(coins, amount, single):
+                    raise exceptions.InsufficientBalance(f'Not enough {coin_type} coins for {amount}!')
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise exceptions.InsufficientBalance(f'No free {coin_type} coins for {amount}!')
+
+                try:
+                    await asyncio.wait_for(self.condition.wait(), remaining)
+
+                except asyncio.TimeoutError:
+                    pass
+
+    async def acquire_objects(self, object_ids: List[str], timeout: Optional[float] = None) -> List[OwnedObject]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (self.timeout if timeout is None else timeout)
+        async with self.condition:
+            while True:
+                await self.client.object_store.sync()
+                objects = self.client.object_store.objects
+                missing = [object_id for object_id in object_ids if object_id not in objects]
+                if missing:
+                    raise exceptions.NoObjects(f'Unknown objects: {missing}')
+
+                if not any(object_id in self.leased for object_id in object_ids):
+                    self.leased.update(object_ids)
+                    return [objects[object_id] for object_id in object_ids]
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise exceptions.TransactionException(f'Objects are leased by other transactions: {object_ids}')
+
+                try:
+                    await asyncio.wait_for(self.condition.wait(), remaining)
+
+                except asyncio.TimeoutError:
+                    pass
+
+    async def release(self, coins: List[OwnedObject]) -> None:
+        async with self.condition:
+            self.leased.difference_update(coin.object_id for coin in coins)
+            self.condition.notify_all()
+
+    @asynccontextmanager
+    async def lease(self, amount: int, coin_type: str = SUI_COIN_TYPE, single: bool = True,
+                    excluding: Optional[List[str]] = None,
+                    timeout: Optional[float] = None) -> AsyncIterator[List[OwnedObject]]:
+        coins = await self.acquire(amount=amount, coin_type=coin_type, single=single, excluding=excluding,
+                                   timeout=timeout)
+        try:
+            yield coins
+
+        finally:
+            await self.release(coins)
@@ -0,0 +1,97 @@
+import random
+import time
+from collections import deque
+from typing import Optional, List, Dict, Tuple
+
+from py_sui_async.models import Endpoint
+from py_sui_async.rate_limiter import TokenBucket
+
+
+class EndpointState:
+    def __init__(self, endpoint: Endpoint, window: int = 100) -> None:
+        self.url = endpoint.url
+        self.weight = endpoint.weight
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.failures = 0
+        self.ejected_until = 0.0
+        self.latencies = deque(maxlen=window)
+        self.limiter = TokenBucket(endpoint.rate_limit)
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.ejected_until
+
+    def quantile(self, q: float = 0.95, min_samples: int = 20) -> Optional[float]:
+        if len(self.latencies) < min_samples:
+            return None
+
+        latencies = sorted(self.latencies)
+        return latencies[min(int(len(latencies) * q), len(latencies) - 1)]
+
+    @property
+    def score(self) -> float:
+        return (self.latency or 0.0) * (1 + 10 * self.error_rate) / self.weight
+
+
+class Router:
+    def __init__(self, endpoints: List[Endpoint], eject_after: int = 3, eject_for: float = 30,
+                 max_eject_for: float = 300, pin_for: float = 30, smoothing: float = 0.2) -> None:
+        self.endpoints = [EndpointState(endpoint) for endpoint in endpoints]
+        self.eject_after = eject_after
+        self.eject_for = eject_for
+        self.max_eject_for = max_eject_for
+        self.pin_for = pin_for
+        self.smoothing = smoothing
+        self._pins: Dict[str, Tuple[EndpointState, float]] = {}
+
+    def select(self, exclude: Optional[List[EndpointState]] = None) -> EndpointState:
+        candidates = [endpoint for endpoint in self.endpoints if not exclude or endpoint not in exclude]
+        if not candidates:
+            candidates = self.endpoints
+
+        healthy = [endpoint for endpoint in candidates if endpoint.healthy]
+        if not healthy:
+            return min(candidates, key=lambda endpoint: endpoint.ejected_until)
+
+        unmeasured = [endpoint for endpoint in healthy if endpoint.latency is None]
+        if unmeasured:
+            return random.choices(unmeasured, weights=[endpoint.weight for endpoint in unmeasured])[0]
+
+        best = min(endpoint.score for endpoint in healthy)
+        fastest = [endpoint for endpoint in healthy if endpoint.score <= best * 1.1]
+        return random.choices(fastest, weights=[endpoint.weight for endpoint in fastest])[0]
+
+    def pinned(self, address: Optional[str]) -> Optional[EndpointState]:
+        pin = self._pins.get(address) if address else None
+        if pin:
+            endpoint, expires = pin
+            if time.monotonic() < expires and endpoint.healthy:
+                return endpoint
+
+            del self._pins[address]
+
+    def for_address(self, address: Optional[str]) -> EndpointState:
+        return self.pinned(address) or self.select()
+
+    def pin(self, address: str, endpoint: EndpointState) -> None:
+        self._pins[address] = (endpoint, time.monotonic() + self.pin_for)
+
+    def success(self, endpoint: EndpointState, latency: float) -> None:
+        endpoint.latencies.append(latency)
+        if endpoint.latency is None:
+            endpoint.latency = latency
+
+        else:
+            endpoint.latency += self.smoothing * (latency - endpoint.latency)
+
+        endpoint.error_rate *= 1 - self.smoothing
+        endpoint.failures = 0
+        endpoint.ejected_until = 0.0
+
+    def failure(self, endpoint: EndpointState) -> None:
+        endpoint.error_rate += self.smoothing * (1 - endpoint.error_rate)
+        endpoint.failures += 1
+        if endpoint.failures >= self.eject_after:
+            eject_for = min(self.eject_for * 2 ** (endpoint.failures - self.eject_after), self.max_eject_for)
+            endpoint.ejected_until = time.monotonic() + eject_for
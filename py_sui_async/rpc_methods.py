@@ -1,3 +1,7 @@
+import asyncio
+import json
+import random
+import time
 import uuid
 from typing import Optional, List, Union
 
@@ -5,6 +9,44 @@ import aiohttp
 
 from py_sui_async import exceptions, types
 from py_sui_async.models import ObjectType
+from py_sui_async.routing import EndpointState
+
+EXECUTE_METHODS = ('sui_executeTransaction', 'sui_executeTransactionSerializedSig')
+READ_METHOD_PREFIXES = ('sui_get', 'sui_tryGet')
+RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+RETRY_WRITE_STATUSES = (429, 503)
+RETRY_CODES = (-32603,)
+
+
+def is_read(json_data: Union[dict, list]) -> bool:
+    return all(item.get('method', '').startswith(READ_METHOD_PREFIXES) for item in
+               (json_data if isinstance(json_data, list) else [json_data]))
+
+
+def retry_delay(e: Exception, attempt: int, read: bool, base: float = 0.5, cap: float = 10) -> Optional[float]:
+    if isinstance(e, exceptions.CircuitOpen):
+        return e.retry_after
+
+    if isinstance(e, exceptions.RPCException):
+        if e.code is not None:
+            retryable = read and e.code in RETRY_CODES
+
+        else:
+            retryable = e.status in (RETRY_STATUSES if read else RETRY_WRITE_STATUSES)
+
+    else:
+        retryable = isinstance(e, aiohttp.ClientConnectorError) or read and isinstance(
+            e, (aiohttp.ClientError, asyncio.TimeoutError)
+        )
+
+    if not retryable:
+        return None
+
+    delay = random.uniform(0, min(cap, base * 2 ** attempt))
+    if isinstance(e, exceptions.RPCException) and e.retry_after:
+        delay = max(delay, e.retry_after)
+
+    return delay
 
 
 class RPC:
@@ -21,17 +63,188 @@ class RPC:
 
     @staticmethod
     async def async_post(client, json_data: Union[dict, list]) -> Optional[dict]:
-        async with aiohttp.ClientSession(headers=client.headers) as session:
-            async with session.post(client.network.rpc, proxy=client.proxy, json=json_data) as response:
-                if response.status <= 201:
-                    json_dict = await response.json()
-                    if 'error' in json_dict:
-                        error = json_dict['error']
-                        raise exceptions.RPCException(response=response, code=error['code'], message=error['message'])
+        if not client.cache:
+            return await RPC._deduplicated_post(client=client, json_data=json_data)
+
+        requests = json_data if isinstance(json_data, list) else [json_data]
+        responses = [None] * len(requests)
+        misses = []
+        for index, request in enumerate(requests):
+            result = client.cache.get(client.network.rpc, request)
+            if result is None:
+                misses.append(index)
 
-                    return json_dict
+            else:
+                responses[index] = {'jsonrpc': '2.0', 'id': request['id'], 'result': result}
+
+        if misses:
+            if isinstance(json_data, dict):
+                fetched = [await RPC._deduplicated_post(client=client, json_data=json_data)]
+
+            else:
+                fetched = await RPC._deduplicated_post(client=client, json_data=[requests[index] for index in misses])
+                by_id = {response.get('id'): response for response in fetched or [] if isinstance(response, dict)}
+                fetched = [by_id.get(requests[index]['id']) for index in misses]
+
+            for index, response in zip(misses, fetched):
+                responses[index] = response
+                if isinstance(response, dict):
+                    client.cache.put(client.network.rpc, requests[index], response)
+
+        if isinstance(json_data, dict):
+            return responses[0]
+
+        return responses
+
+    @staticmethod
+    async def _deduplicated_post(client, json_data: Union[dict, list]) -> Optional[dict]:
+        if not isinstance(json_data, dict) or not client.transport.dedup or not is_read(json_data):
+            return await RPC._async_post(client=client, json_data=json_data)
+
+        address = client.account.address if client.account else None
+        endpoint = client.transport.router(client.network).pinned(address)
+        key = (endpoint.url if endpoint else client.network.rpc, json_data['method'],
+               json.dumps(json_data['params'], sort_keys=True))
+        inflight = client.transport.inflight
+        future = inflight.get(key)
+        if not future:
+            future = asyncio.ensure_future(RPC._async_post(client=client, json_data=json_data))
+            inflight[key] = future
+
+            def done(_) -> None:
+                if inflight.get(key) is future:
+                    del inflight[key]
+
+                if not future.cancelled():
+                    future.exception()
+
+            future.add_done_callback(done)
+
+        response = await asyncio.shield(future)
+        if isinstance(response, dict) and response.get('id') != json_data['id']:
+            response = {**response, 'id': json_data['id']}
+
+        return response
+
+    @staticmethod
+    async def _async_post(client, json_data: Union[dict, list]) -> Optional[dict]:
+        if isinstance(json_data, dict) and client.batcher and is_read(json_data):
+            return await client.batcher.submit(client=client, json_data=json_data)
+
+        return await RPC.send(client=client, json_data=json_data)
+
+    @staticmethod
+    async def send(client, json_data: Union[dict, list],
+                   endpoint: Optional[EndpointState] = None) -> Optional[dict]:
+        router = client.transport.router(client.network)
+        address = client.account.address if client.account else None
+        endpoint = endpoint or router.for_address(address)
+        read = is_read(json_data)
+        attempt = 0
+        error = None
+        while True:
+            try:
+                return await RPC._hedge(client=client, json_data=json_data, endpoint=endpoint, read=read,
+                                        retry=attempt > 0)
+
+            except Exception as e:
+                if not isinstance(e, exceptions.CircuitOpen):
+                    error = e
+
+                delay = retry_delay(e, attempt, read)
+                if delay is None or attempt >= client.retries:
+                    if error and error is not e:
+                        raise error
+
+                    raise
+
+            attempt += 1
+            await asyncio.sleep(delay)
+            endpoint = router.pinned(address) or router.select(exclude=[endpoint])
+
+    @staticmethod
+    async def _hedge(client, json_data: Union[dict, list], endpoint: EndpointState, read: bool,
+                     retry: bool = False) -> Optional[dict]:
+        router = client.transport.router(client.network)
+        address = client.account.address if client.account else None
+        delay = endpoint.quantile(client.hedge) if client.hedge else None
+        if delay is None or len(router.endpoints) < 2 or router.pinned(address) or not read:
+            return await RPC._post(client=client, json_data=json_data, endpoint=endpoint, retry=retry)
+
+        tasks = [asyncio.ensure_future(RPC._post(client=client, json_data=json_data, endpoint=endpoint,
+                                                 retry=retry))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                tasks.append(asyncio.ensure_future(RPC._post(
+                    client=client, json_data=json_data, endpoint=router.select(exclude=[endpoint]), retry=retry
+                )))
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.exception():
+                        return task.result()
+
+            return tasks[0].result()
+
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    @staticmethod
+    async def _post(client, json_data: Union[dict, list], endpoint: EndpointState,
+                    retry: bool = False) -> Optional[dict]:
+        router = client.transport.router(client.network)
+        address = client.account.address if client.account else None
+        if not endpoint.healthy:
+            raise exceptions.CircuitOpen(endpoint.url, reopens_in=endpoint.ejected_until - time.monotonic())
+
+        proxy_limiter = client.transport.limiter(client.proxy)
+        await endpoint.limiter.acquire()
+        await proxy_limiter.acquire()
+        session = await client.transport.get_session()
+        started = time.monotonic()
+        try:
+            async with session.post(endpoint.url, headers=client.headers, proxy=client.proxy,
+                                    json=json_data) as response:
+                if response.status > 201:
+                    raise exceptions.RPCException(response=response)
+
+                json_dict = await response.json()
 
-                raise exceptions.RPCException(response=response)
+        except exceptions.RPCException as e:
+            if e.status == 429:
+                endpoint.limiter.pause(e.retry_after or 1)
+                proxy_limiter.pause(e.retry_after or 1)
+
+            elif e.status >= 500:
+                if not retry:
+                    router.failure(endpoint)
+
+            else:
+                router.success(endpoint, time.monotonic() - started)
+
+            raise
+
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if not retry:
+                router.failure(endpoint)
+
+            raise
+
+        router.success(endpoint, time.monotonic() - started)
+        methods = [item.get('method') for item in (json_data if isinstance(json_data, list) else [json_data])]
+        if address and any(method in EXECUTE_METHODS for method in methods):
+            router.pin(address, endpoint)
+
+        if isinstance(json_dict, dict) and 'error' in json_dict:
+            error = json_dict['error']
+            raise exceptions.RPCException(response=response, code=error['code'], message=error['message'])
+
+        return json_dict
 
     @staticmethod
     async def batchTransaction(client, signer: types.SuiAddress,
@@ -1,112 +1,305 @@
+import asyncio
 import base64
 import logging
-from typing import Optional, List
+import math
+from typing import Optional, List, Union, Dict, AsyncIterator, Tuple
+
+from pretty_utils.type_functions.lists import split_list
 
 from py_sui_async import exceptions, types
-from py_sui_async.models import History, Tx, Coin, Nft, StringAndBytes
+from py_sui_async.bcs import TransactionBuilder, CallArg, Pure, ObjectArg, ObjVec
+from py_sui_async.models import History, Tx, Coin, Nft, StringAndBytes, Balance, ObjectID, OwnedObject, ExecuteType
+from py_sui_async.pagination import iter_transactions
 from py_sui_async.rpc_methods import RPC
+from py_sui_async.utils import get_results, get_effects, get_digest
+
+MAX_MERGE_INPUTS = 256
 
 
 class Transaction:
     def __init__(self, client):
         self.client = client
+        self._packages: Dict[str, OwnedObject] = {}
+
+    async def _get_txs(self, digests: List[str], address: str, direction: str, semaphore: asyncio.Semaphore,
+                       keep_raw: bool = True) -> List[Tx]:
+        if not digests:
+            return []
+
+        json_data = [await RPC.getTransaction(client=self.client, digest=digest, get_json=True) for digest in digests]
+        async with semaphore:
+            results = await get_results(await RPC.async_post(client=self.client, json_data=json_data))
+
+        txs = []
+        incoming = direction == 'incoming'
+        for tx in results:
+            certificate = tx['certificate']
+            data = certificate['data']
+            txs.append(Tx(digest=certificate['transactionDigest'], status=tx['effects']['status']['status'],
+                          timestamp=int(tx['timestamp_ms'] / 1000), transactions=data['transactions'],
+                          sender=address if incoming else data['sender'],
+                          recipients=None if incoming else [address], raw_dict=tx if keep_raw else None,
+                          direction=direction))
+
+        return txs
+
+    async def _new_digests(self, query: types.TransactionQuery, last_digest: Optional[str]) -> List[str]:
+        digests = []
+        async for digest in iter_transactions(client=self.client, query=query, descending_order=True,
+                                              page_size=50 if last_digest else None, prefetch=not last_digest):
+            if digest == last_digest:
+                break
 
-    async def history(self, address: Optional[str] = None) -> History:
-        history = History(incoming=[], outgoing=[])
+            digests.append(digest)
+
+        return digests
+
+    async def _iter_history_batches(self, address: str, full_resync: bool = False, batch_size: int = 50,
+                                    max_concurrency: int = 4,
+                                    keep_raw: bool = True) -> AsyncIterator[Tuple[str, int, List[Tx]]]:
+        store = self.client.history_store
+        if store and full_resync:
+            store.clear(address)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        listings = {
+            asyncio.ensure_future(self._new_digests(
+                query=query, last_digest=store.last_digest(address, direction) if store else None
+            )): direction for direction, query in (('incoming', {'ToAddress': address}),
+                                                   ('outgoing', {'FromAddress': address}))
+        }
+        fetches: Dict[asyncio.Future, Tuple[str, int]] = {}
+        chunks: Dict[str, int] = {}
+        fetched: Dict[str, Dict[int, List[Tx]]] = {'incoming': {}, 'outgoing': {}}
         try:
-            if not address:
-                address = self.client.account.address
-
-            json_data = [
-                await RPC.getTransactions(client=self.client, query={'ToAddress': address}, cursor=None, limit=None,
-                                          descending_order=True, get_json=True),
-                await RPC.getTransactions(client=self.client, query={'FromAddress': address}, cursor=None, limit=None,
-                                          descending_order=True, get_json=True),
-            ]
-            response = await RPC.async_post(client=self.client, json_data=json_data)
-            try:
-                incoming_txs = response[0]['result']['data']
-                json_data = [await RPC.getTransaction(client=self.client, digest=tx, get_json=True) for tx in
-                             incoming_txs]
-                incoming_txs = [incoming_tx['result'] for incoming_tx in
-                                await RPC.async_post(client=self.client, json_data=json_data)]
-                for incoming_tx in incoming_txs:
-                    certificate = incoming_tx['certificate']
-                    data = certificate['data']
-                    history.incoming.append(Tx(digest=certificate['transactionDigest'],
-                                               status=incoming_tx['effects']['status']['status'],
-                                               timestamp=int(incoming_tx['timestamp_ms'] / 1000),
-                                               transactions=data['transactions'], sender=address, recipients=None,
-                                               raw_dict=incoming_tx))
-            except:
-                pass
+            while listings or fetches:
+                done, _ = await asyncio.wait(set(listings) | set(fetches), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task in listings:
+                        direction = listings.pop(task)
+                        digest_chunks = [chunk for chunk in split_list(task.result(), batch_size) if chunk]
+                        chunks[direction] = len(digest_chunks)
+                        for i, digests in enumerate(digest_chunks):
+                            fetches[asyncio.ensure_future(self._get_txs(
+                                digests=digests, address=address, direction=direction, semaphore=semaphore,
+                                keep_raw=keep_raw
+                            ))] = (direction, i)
 
-            try:
-                outgoing_txs = response[1]['result']['data']
-                json_data = [await RPC.getTransaction(client=self.client, digest=tx, get_json=True) for tx in
-                             outgoing_txs]
-                outgoing_txs = [outgoing_tx['result'] for outgoing_tx in
-                                await RPC.async_post(client=self.client, json_data=json_data)]
-                for outgoing_tx in outgoing_txs:
-                    certificate = outgoing_tx['certificate']
-                    data = certificate['data']
-                    history.outgoing.append(Tx(digest=certificate['transactionDigest'],
-                                               status=outgoing_tx['effects']['status']['status'],
-                                               timestamp=int(outgoing_tx['timestamp_ms'] / 1000),
-                                               transactions=data['transactions'], sender=data['sender'],
-                                               recipients=[address], raw_dict=outgoing_tx))
-
-            except:
-                pass
+                    else:
+                        direction, i = fetches.pop(task)
+                        txs = task.result()
+                        fetched[direction][i] = txs
+                        yield direction, i, txs
 
-        except:
-            logging.exception('history')
+                    if store and direction in chunks and len(fetched[direction]) == chunks[direction]:
+                        store.add(address, direction, [tx for i in range(chunks[direction]) for tx in
+                                                       fetched[direction][i]])
+                        del chunks[direction]
 
         finally:
-            return history
+            for task in list(listings) + list(fetches):
+                task.cancel()
 
-    async def move_call(self, package_object_id: types.ObjectID, module: str, function: str,
-                        type_arguments: Optional[List[types.TypeTag]], arguments: List[types.SuiJsonValue],
-                        gas_budget: int = 10_000, gas_price: Optional[int] = None) -> Optional[dict]:
-        gas = await self.client.wallet.find_object_for_gas(gas_budget=gas_budget, gas_price=gas_price)
-        if not gas:
-            raise exceptions.InsufficientGas()
+    async def iter_history(self, address: Optional[str] = None, full_resync: bool = False, batch_size: int = 50,
+                           max_concurrency: int = 4, keep_raw: bool = True) -> AsyncIterator[Tx]:
+        async for _, _, txs in self._iter_history_batches(
+                address=address or self.client.account.address, full_resync=full_resync, batch_size=batch_size,
+                max_concurrency=max_concurrency, keep_raw=keep_raw
+        ):
+            for tx in txs:
+                yield tx
 
-        response = await RPC.moveCall(client=self.client, signer=self.client.account.address,
-                                      package_object_id=package_object_id, module=module, function=function,
-                                      type_arguments=type_arguments, arguments=arguments, gas=gas,
-                                      gas_budget=gas_budget)
-        tx_bytes = str(response['result']['txBytes'])
-        tx_bytes = StringAndBytes(str_=tx_bytes, bytes_=base64.b64decode(tx_bytes))
-        return await self.client.sign_and_execute(tx_bytes)
+    async def history(self, address: Optional[str] = None, full_resync: bool = False, batch_size: int = 50,
+                      max_concurrency: int = 4, keep_raw: bool = True) -> History:
+        if not address:
+            address = self.client.account.address
 
-    async def merge_coin(self, coin: Coin, gas_budget: int = 1_000,
-                         gas_price: Optional[int] = None) -> Optional[List[dict]]:
-        responses = []
+        batches: Dict[str, Dict[int, List[Tx]]] = {'incoming': {}, 'outgoing': {}}
+        async for direction, i, txs in self._iter_history_batches(
+                address=address, full_resync=full_resync, batch_size=batch_size, max_concurrency=max_concurrency,
+                keep_raw=keep_raw
+        ):
+            batches[direction][i] = txs
+
+        store = self.client.history_store
+        if store:
+            return History(incoming=store.get(address, 'incoming'), outgoing=store.get(address, 'outgoing'))
+
+        incoming, outgoing = batches['incoming'], batches['outgoing']
+        return History(incoming=[tx for i in sorted(incoming) for tx in incoming[i]],
+                       outgoing=[tx for i in sorted(outgoing) for tx in outgoing[i]])
+
+    async def wait_for(self, digests: List[str],
+                       timeout: Optional[float] = None) -> AsyncIterator[Tuple[str, dict]]:
+        tracker = self.client.confirmations
+        loop = asyncio.get_running_loop()
+        timeout = tracker.timeout if timeout is None else timeout
+        deadline = loop.time() + timeout if timeout else None
+        owned = [digest for digest in digests if digest not in tracker.pending]
+        pending = {tracker.track(digest, timeout=timeout, submitted=False): digest for digest in digests}
         try:
-            gas = await self.client.wallet.find_object_for_gas(gas_budget=gas_budget, gas_price=gas_price)
+            while pending:
+                remaining = None if deadline is None else max(deadline - loop.time(), 0)
+                done, _ = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    digest = next(iter(pending.values()))
+                    raise exceptions.TransactionException(f'Transaction {digest} was not confirmed')
+
+                for future in done:
+                    yield pending.pop(future), future.result()
+
+        finally:
+            for digest in owned:
+                tracker.untrack(digest)
+
+    async def _remote_tx_bytes(self, response: dict) -> StringAndBytes:
+        tx_bytes = str(response['result']['txBytes'])
+        return StringAndBytes(str_=tx_bytes, bytes_=base64.b64decode(tx_bytes))
+
+    async def _offline_tx_bytes(self, kind: Union[bytes, List[bytes]], gas: Union[ObjectID, OwnedObject],
+                                gas_budget: int, gas_price: Optional[int] = None) -> StringAndBytes:
+        if not gas_price:
+            gas_price = await self.client.wallet.reference_gas_price()
+
+        tx_bytes = TransactionBuilder(self.client.account.address).build(kinds=kind, gas=gas, gas_price=gas_price,
+                                                                         gas_budget=gas_budget)
+        return StringAndBytes(str_=base64.b64encode(tx_bytes).decode(), bytes_=tx_bytes)
+
+    async def _object_ref(self, object_id: types.ObjectID,
+                          balance: Optional[Balance] = None) -> Optional[Union[ObjectID, OwnedObject]]:
+        if not self.client.offline_build:
+            return None
+
+        if self.client.object_store and object_id in self.client.object_store.objects:
+            obj = self.client.object_store.objects[object_id]
+            if obj.version is not None and obj.digest:
+                return obj
+
+        if balance:
+            coins = ([balance.coin] if balance.coin else []) + list(balance.tokens.values())
+            for coin in coins:
+                for obj in coin.object_ids:
+                    if obj.id == object_id and obj.version is not None and obj.digest:
+                        return obj
+
+    async def _acquire_gas(self, gas_budget: int, gas_price: Optional[int] = None, balance: Optional[Balance] = None,
+                           excluding: Optional[List[str]] = None) -> Tuple[str, Optional[List[OwnedObject]]]:
+        if not self.client.reservations:
+            gas = await self.client.wallet.find_object_for_gas(gas_budget=gas_budget, gas_price=gas_price,
+                                                               balance=balance, excluding=excluding or '')
             if not gas:
                 raise exceptions.InsufficientGas()
 
-            if coin.object_ids[0].id == gas:
-                primary_coin = coin.object_ids[1].id
+            return gas, None
+
+        if not gas_price:
+            gas_price = await self.client.wallet.reference_gas_price()
+
+        try:
+            coins = await self.client.reservations.acquire(amount=gas_budget * gas_price, excluding=excluding,
+                                                           prefer=self.client.wallet.gas_pool)
+
+        except exceptions.InsufficientBalance as e:
+            raise exceptions.InsufficientGas(str(e))
+
+        return coins[0].object_id, coins
+
+    async def _release(self, coins: Optional[List[OwnedObject]], response: Optional[dict] = None) -> None:
+        if not coins:
+            return
+
+        digest = await get_digest(response) if response and not await get_effects(response) else None
+        if digest:
+            self.client.confirmations.track(digest).add_done_callback(
+                lambda _: asyncio.ensure_future(self._release(coins))
+            )
+            return
+
+        await self.client.reservations.release(coins)
+        if any(coin.object_id in self.client.wallet.gas_pool for coin in coins):
+            self.client.wallet.schedule_gas_pool_top_up()
+
+    async def _package_ref(self, package_object_id: types.ObjectID) -> Optional[OwnedObject]:
+        if package_object_id not in self._packages:
+            reference = (await RPC.getObject(client=self.client, object_id=package_object_id))['result']['details']
+            reference = reference['reference']
+            self._packages[package_object_id] = OwnedObject(object_id=reference['objectId'],
+                                                            version=reference['version'], digest=reference['digest'])
+
+        return self._packages[package_object_id]
+
+    async def move_call(self, package_object_id: types.ObjectID, module: str, function: str,
+                        type_arguments: Optional[List[types.TypeTag]],
+                        arguments: List[Union[types.SuiJsonValue, CallArg]],
+                        gas_budget: int = 10_000, gas_price: Optional[int] = None,
+                        request_type: str = ExecuteType.WaitForLocalExecution) -> Optional[dict]:
+        balance = await self.client.wallet.coins() if self.client.offline_build else None
+        gas, leased = await self._acquire_gas(gas_budget=gas_budget, gas_price=gas_price, balance=balance)
+        response = None
+        try:
+            gas_ref = await self._object_ref(object_id=gas, balance=balance)
+            if gas_ref and all(isinstance(argument, (Pure, ObjectArg, ObjVec)) for argument in arguments):
+                kind = TransactionBuilder(self.client.account.address).move_call(
+                    package=await self._package_ref(package_object_id), module=module, function=function,
+                    type_arguments=type_arguments, arguments=arguments
+                )
+                tx_bytes = await self._offline_tx_bytes(kind=kind, gas=gas_ref, gas_budget=gas_budget,
+                                                        gas_price=gas_price)
+
+            else:
+                tx_bytes = await self._remote_tx_bytes(
+                    await RPC.moveCall(client=self.client, signer=self.client.account.address,
+                                       package_object_id=package_object_id, module=module, function=function,
+                                       type_arguments=type_arguments, arguments=arguments, gas=gas,
+                                       gas_budget=gas_budget)
+                )
+
+            response = await self.client.sign_and_execute(tx_bytes, request_type=request_type)
+            return response
+
+        finally:
+            await self._release(leased, response)
+
+    async def merge_coin(self, coin: Coin, gas_budget: int = 1_000, gas_price: Optional[int] = None,
+                         chunk_size: int = MAX_MERGE_INPUTS,
+                         request_type: str = ExecuteType.WaitForLocalExecution) -> Optional[List[Optional[dict]]]:
+        responses = []
+        try:
+            object_ids = [object_id.id for object_id in sorted(coin.object_ids, key=lambda obj: obj.amount,
+                                                                reverse=True)]
+            count = math.ceil(len(object_ids) / chunk_size)
+            size, extra = divmod(len(object_ids), count) if count else (0, 0)
+            bounds = [i * size + min(i, extra) for i in range(count + 1)]
+            chunks = [object_ids[bounds[i]:bounds[i + 1]] for i in range(count)]
+            chunks = [chunk for chunk in chunks if len(chunk) > 1]
+            if coin.name == 'sui':
+                merge = self._merge_sui_chunk
 
             else:
-                primary_coin = coin.object_ids[0].id
-
-            objects_to_merge = [object_id.id for object_id in coin.object_ids]
-            objects_to_merge.remove(primary_coin)
-            if gas in objects_to_merge:
-                objects_to_merge.remove(gas)
-
-            for object_id in objects_to_merge:
-                response = await RPC.mergeCoins(client=self.client, signer=self.client.account.address,
-                                                primary_coin=primary_coin, coin_to_merge=object_id, gas=gas,
-                                                gas_budget=gas_budget)
-                tx_bytes = str(response['result']['txBytes'])
-                tx_bytes = StringAndBytes(str_=tx_bytes, bytes_=base64.b64decode(tx_bytes))
-                response = await self.client.sign_and_execute(tx_bytes)
-                responses.append(response)
+                merge = self._merge_token_chunk
+
+            if coin.name == 'sui' or self.client.reservations:
+                results = await asyncio.gather(*[
+                    merge(coin=coin, object_ids=chunk, gas_budget=gas_budget, gas_price=gas_price,
+                          request_type=request_type) for chunk in chunks
+                ], return_exceptions=True)
+
+            else:
+                results = []
+                for chunk in chunks:
+                    try:
+                        results.append(await merge(coin=coin, object_ids=chunk, gas_budget=gas_budget,
+                                                   gas_price=gas_price, request_type=request_type))
+
+                    except Exception as e:
+                        results.append(e)
+
+            for result in results:
+                if isinstance(result, Exception):
+                    logging.error(f'merge_coin: {result!r}')
+                    result = None
+
+                responses.append(result)
 
         except:
             logging.exception('merge_coin')
@@ -114,22 +307,116 @@ class Transaction:
         finally:
             return responses
 
+    async def _merge_sui_chunk(self, coin: Coin, object_ids: List[types.ObjectID], gas_budget: int = 1_000,
+                               gas_price: Optional[int] = None,
+                               request_type: str = ExecuteType.WaitForLocalExecution) -> Optional[dict]:
+        reserved = None
+        if self.client.reservations:
+            reserved = await self.client.reservations.acquire_objects(object_ids)
+
+        response = None
+        try:
+            coin_refs = [await self._object_ref(object_id=object_id) for object_id in object_ids]
+            if all(coin_refs):
+                kind = TransactionBuilder(self.client.account.address).pay_all_sui(
+                    coins=coin_refs, recipient=self.client.account.address
+                )
+                tx_bytes = await self._offline_tx_bytes(kind=kind, gas=coin_refs[0], gas_budget=gas_budget,
+                                                        gas_price=gas_price)
+
+            else:
+                tx_bytes = await self._remote_tx_bytes(
+                    await RPC.payAllSui(client=self.client, signer=self.client.account.address,
+                                        input_coins=object_ids, recipient=self.client.account.address,
+                                        gas_budget=gas_budget)
+                )
+
+            response = await self.client.sign_and_execute(tx_bytes, request_type=request_type)
+            return response
+
+        finally:
+            await self._release(reserved, response)
+
+    async def _merge_token_chunk(self, coin: Coin, object_ids: List[types.ObjectID], gas_budget: int = 1_000,
+                                 gas_price: Optional[int] = None,
+                                 request_type: str = ExecuteType.WaitForLocalExecution) -> Optional[dict]:
+        reserved = None
+        if self.client.reservations:
+            reserved = await self.client.reservations.acquire_objects(object_ids)
+
+        leased = None
+        response = None
+        try:
+            gas, leased = await self._acquire_gas(gas_budget=gas_budget, gas_price=gas_price, excluding=object_ids)
+            coin_type = f'{coin.package_id}::{coin.name}::{coin.symbol}'
+            primary_coin = object_ids[0]
+            gas_ref = await self._object_ref(object_id=gas)
+            coin_refs = [await self._object_ref(object_id=object_id) for object_id in object_ids]
+            if gas_ref and all(coin_refs):
+                builder = TransactionBuilder(self.client.account.address)
+                package = await self._package_ref('0x2')
+                kinds = [builder.merge_coins(package=package, coin_type=coin_type, primary_coin=coin_refs[0],
+                                             coin_to_merge=coin_ref) for coin_ref in coin_refs[1:]]
+                tx_bytes = await self._offline_tx_bytes(kind=kinds, gas=gas_ref, gas_budget=gas_budget,
+                                                        gas_price=gas_price)
+
+            else:
+                single_transaction_params = [{
+                    'moveCallRequestParams': {
+                        'packageObjectId': '0x2', 'module': 'pay', 'function': 'join',
+                        'typeArguments': [coin_type], 'arguments': [primary_coin, object_id]
+                    }
+                } for object_id in object_ids[1:]]
+                tx_bytes = await self._remote_tx_bytes(
+                    await RPC.batchTransaction(client=self.client, signer=self.client.account.address,
+                                               single_transaction_params=single_transaction_params, gas=gas,
+                                               gas_budget=gas_budget)
+                )
+
+            response = await self.client.sign_and_execute(tx_bytes, request_type=request_type)
+            return response
+
+        finally:
+            await self._release(leased, response)
+            await self._release(reserved, response)
+
     async def send_object(self, object_id: types.ObjectID, recipient: types.SuiAddress, gas_budget: int = 1_000,
-                          gas_price: Optional[int] = None) -> Optional[dict]:
-        gas = await self.client.wallet.find_object_for_gas(gas_budget=gas_budget, gas_price=gas_price)
-        if not gas:
-            raise exceptions.InsufficientGas()
+                          gas_price: Optional[int] = None,
+                          request_type: str = ExecuteType.WaitForLocalExecution) -> Optional[dict]:
+        balance = await self.client.wallet.coins() if self.client.offline_build else None
+        gas, leased = await self._acquire_gas(gas_budget=gas_budget, gas_price=gas_price, balance=balance,
+                                              excluding=[object_id])
+        response = None
+        try:
+            gas_ref = await self._object_ref(object_id=gas, balance=balance)
+            obj_ref = await self._object_ref(object_id=object_id, balance=balance)
+            if gas_ref and obj_ref:
+                kind = TransactionBuilder(self.client.account.address).transfer_object(recipient=recipient,
+                                                                                       obj=obj_ref)
+                tx_bytes = await self._offline_tx_bytes(kind=kind, gas=gas_ref, gas_budget=gas_budget,
+                                                        gas_price=gas_price)
 
-        response = await RPC.transferObject(client=self.client, signer=self.client.account.address,
-                                            object_id=object_id, recipient=recipient, gas=gas,
-                                            gas_budget=gas_budget)
-        tx_bytes = str(response['result']['txBytes'])
-        tx_bytes = StringAndBytes(str_=tx_bytes, bytes_=base64.b64decode(tx_bytes))
-        return await self.client.sign_and_execute(tx_bytes)
+            else:
+                tx_bytes = await self._remote_tx_bytes(
+                    await RPC.transferObject(client=self.client, signer=self.client.account.address,
+                                             object_id=object_id, recipient=recipient, gas=gas,
+                                             gas_budget=gas_budget)
+                )
+
+            response = await self.client.sign_and_execute(tx_bytes, request_type=request_type)
+            return response
+
+        finally:
+            await self._release(leased, response)
 
     async def send_coin(self, recipient: types.SuiAddress, amount: int, gas_budget: int = 1_000,
-                        gas_price: Optional[int] = None) -> Optional[dict]:
-        balance = await self.client.wallet.balance()
+                        gas_price: Optional[int] = None,
+                        request_type: str = ExecuteType.WaitForLocalExecution) -> Optional[dict]:
+        if self.client.reservations:
+            return await self._send_coin_reserved(recipient=recipient, amount=amount, gas_budget=gas_budget,
+                                                  gas_price=gas_price, request_type=request_type)
+
+        balance = await self.client.wallet.coins()
         gas = await self.client.wallet.find_object_for_gas(gas_budget=gas_budget, gas_price=gas_price, balance=balance)
         if not gas:
             raise exceptions.InsufficientGas()
@@ -137,32 +424,92 @@ class Transaction:
         input_coins = [object_id.id for object_id in sorted(balance.coin.object_ids, key=lambda obj: obj.amount)]
         input_coins.remove(gas)
         input_coins = [gas] + input_coins
-        response = await RPC.paySui(client=self.client, signer=self.client.account.address, input_coins=input_coins,
-                                    recipients=[recipient], amounts=[amount], gas_budget=gas_budget)
-        tx_bytes = str(response['result']['txBytes'])
-        tx_bytes = StringAndBytes(str_=tx_bytes, bytes_=base64.b64decode(tx_bytes))
-        return await self.client.sign_and_execute(tx_bytes)
+        return await self.pay_sui(input_coins=input_coins, recipients=[recipient], amounts=[amount],
+                                  gas_budget=gas_budget, gas_price=gas_price, balance=balance,
+                                  request_type=request_type)
+
+    async def _send_coin_reserved(self, recipient: types.SuiAddress, amount: int, gas_budget: int = 1_000,
+                                  gas_price: Optional[int] = None,
+                                  request_type: str = ExecuteType.WaitForLocalExecution) -> Optional[dict]:
+        if not gas_price:
+            gas_price = await self.client.wallet.reference_gas_price()
+
+        coins = await self.client.reservations.acquire(amount=amount + gas_budget * gas_price, single=False,
+                                                       excluding=list(self.client.wallet.gas_pool))
+        response = None
+        try:
+            response = await self.pay_sui(input_coins=[coin.object_id for coin in coins], recipients=[recipient],
+                                          amounts=[amount], gas_budget=gas_budget, gas_price=gas_price,
+                                          request_type=request_type)
+            return response
+
+        finally:
+            await self._release(coins, response)
+
+    async def pay_sui(self, input_coins: List[types.ObjectID], recipients: List[types.SuiAddress],
+                      amounts: List[int], gas_budget: int = 1_000, gas_price: Optional[int] = None,
+                      balance: Optional[Balance] = None,
+                      request_type: str = ExecuteType.WaitForLocalExecution) -> Optional[dict]:
+        coin_refs = [await self._object_ref(object_id=object_id, balance=balance) for object_id in input_coins]
+        if all(coin_refs):
+            kind = TransactionBuilder(self.client.account.address).pay_sui(coins=coin_refs, recipients=recipients,
+                                                                           amounts=amounts)
+            tx_bytes = await self._offline_tx_bytes(kind=kind, gas=coin_refs[0], gas_budget=gas_budget,
+                                                    gas_price=gas_price)
+
+        else:
+            tx_bytes = await self._remote_tx_bytes(
+                await RPC.paySui(client=self.client, signer=self.client.account.address, input_coins=input_coins,
+                                 recipients=recipients, amounts=amounts, gas_budget=gas_budget)
+            )
+
+        return await self.client.sign_and_execute(tx_bytes, request_type=request_type)
 
     async def send_token(self, token: Optional[Coin], recipient: types.SuiAddress, amount: int, gas_budget: int = 1_000,
-                         gas_price: Optional[int] = None) -> Optional[dict]:
-        balance = await self.client.wallet.balance()
+                         gas_price: Optional[int] = None,
+                         request_type: str = ExecuteType.WaitForLocalExecution) -> Optional[dict]:
+        balance = await self.client.wallet.coins()
         if token.name in balance.tokens:
-            gas = await self.client.wallet.find_object_for_gas(gas_budget=gas_budget, gas_price=gas_price,
-                                                               balance=balance)
-            if not gas:
-                raise exceptions.InsufficientGas()
-
+            coins = None
+            leased = None
+            response = None
             input_coins = [object_id.id for object_id in balance.tokens[token.name].object_ids]
-            response = await RPC.pay(client=self.client, signer=self.client.account.address, input_coins=input_coins,
-                                     recipients=[recipient], amounts=[amount], gas=gas, gas_budget=gas_budget)
-            tx_bytes = str(response['result']['txBytes'])
-            tx_bytes = StringAndBytes(str_=tx_bytes, bytes_=base64.b64decode(tx_bytes))
-            return await self.client.sign_and_execute(tx_bytes)
+            if self.client.reservations:
+                coin_type = f'{token.package_id}::{token.name}::{token.symbol}'
+                coins = await self.client.reservations.acquire(amount=amount, coin_type=coin_type, single=False)
+                input_coins = [coin.object_id for coin in coins]
+
+            try:
+                gas, leased = await self._acquire_gas(gas_budget=gas_budget, gas_price=gas_price, balance=balance)
+                gas_ref = await self._object_ref(object_id=gas, balance=balance)
+                coin_refs = [await self._object_ref(object_id=object_id, balance=balance) for object_id in
+                             input_coins]
+                if gas_ref and all(coin_refs):
+                    kind = TransactionBuilder(self.client.account.address).pay(
+                        coins=coin_refs, recipients=[recipient], amounts=[amount]
+                    )
+                    tx_bytes = await self._offline_tx_bytes(kind=kind, gas=gas_ref, gas_budget=gas_budget,
+                                                            gas_price=gas_price)
+
+                else:
+                    tx_bytes = await self._remote_tx_bytes(
+                        await RPC.pay(client=self.client, signer=self.client.account.address,
+                                      input_coins=input_coins, recipients=[recipient], amounts=[amount], gas=gas,
+                                      gas_budget=gas_budget)
+                    )
+
+                response = await self.client.sign_and_execute(tx_bytes, request_type=request_type)
+                return response
+
+            finally:
+                await self._release(leased, response)
+                await self._release(coins, response)
 
         else:
             raise exceptions.NoSuchToken('There is no such token!')
 
     async def send_nft(self, nft: Nft, recipient: types.SuiAddress, gas_budget: int = 1_000,
-                       gas_price: Optional[int] = None) -> Optional[dict]:
+                       gas_price: Optional[int] = None,
+                       request_type: str = ExecuteType.WaitForLocalExecution) -> Optional[dict]:
         return await self.send_object(object_id=nft.object_id, recipient=recipient, gas_budget=gas_budget,
-                                      gas_price=gas_price)
+                                      gas_price=gas_price, request_type=request_type)
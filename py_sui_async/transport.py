@@ -0,0 +1,88 @@
+import asyncio
+from typing import Optional, Dict, TYPE_CHECKING
+
+import aiohttp
+
+from py_sui_async.models import Network
+from py_sui_async.rate_limiter import TokenBucket
+from py_sui_async.routing import Router
+
+if TYPE_CHECKING:
+    from py_sui_async.events import SubscriptionManager
+
+
+class Transport:
+    def __init__(self, limit: int = 100, limit_per_host: int = 0, ttl_dns_cache: Optional[int] = 300,
+                 keepalive_timeout: float = 30, timeout: Optional[aiohttp.ClientTimeout] = None,
+                 proxy_rate_limit: Optional[float] = None, dedup: bool = True) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout or aiohttp.ClientTimeout(total=60)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self.proxy_rate_limit = proxy_rate_limit
+        self.dedup = dedup
+        self.inflight: Dict[tuple, asyncio.Future] = {}
+        self._routers: Dict[str, Router] = {}
+        self._limiters: Dict[Optional[str], TokenBucket] = {}
+        self._subscriptions: Dict[tuple, 'SubscriptionManager'] = {}
+
+    @property
+    def closed(self) -> bool:
+        return self._session is None or self._session.closed
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        if not self.closed:
+            return self._session
+
+        if not self._lock:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self.closed:
+                connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host,
+                                                 ttl_dns_cache=self.ttl_dns_cache, use_dns_cache=True,
+                                                 keepalive_timeout=self.keepalive_timeout)
+                self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+
+        return self._session
+
+    def router(self, network: Network) -> Router:
+        if network.rpc not in self._routers:
+            self._routers[network.rpc] = Router(network.all_endpoints)
+
+        return self._routers[network.rpc]
+
+    def limiter(self, proxy: Optional[str]) -> TokenBucket:
+        if proxy not in self._limiters:
+            self._limiters[proxy] = TokenBucket(self.proxy_rate_limit)
+
+        return self._limiters[proxy]
+
+    def subscriptions(self, client) -> 'SubscriptionManager':
+        from py_sui_async.events import SubscriptionManager
+
+        key = (client.network.websocket, client.proxy)
+        if key not in self._subscriptions:
+            self._subscriptions[key] = SubscriptionManager(client)
+
+        return self._subscriptions[key]
+
+    async def close(self) -> None:
+        for manager in self._subscriptions.values():
+            await manager.close()
+
+        self._subscriptions = {}
+        if not self.closed:
+            await self._session.close()
+
+        self._session = None
+
+    async def __aenter__(self) -> 'Transport':
+        await self.get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -1,8 +1,18 @@
+import functools
 import logging
+from typing import Optional, List
 
 from pretty_utils.type_functions.strings import text_between
 
-from py_sui_async.models import ObjectType, Coin
+from py_sui_async import exceptions
+from py_sui_async.models import ObjectType, Coin, Balance, ObjectID
+
+
+@functools.lru_cache(maxsize=1)
+def get_user_agent() -> str:
+    from fake_useragent import UserAgent
+
+    return UserAgent().chrome
 
 
 async def parse_type(raw_type: str) -> ObjectType:
@@ -26,3 +36,90 @@ async def parse_type(raw_type: str) -> ObjectType:
 
     finally:
         return type_instance
+
+
+async def parse_coin_type(coin_type: str) -> Coin:
+    type_details = coin_type.split('::')
+    return Coin(package_id=type_details[0], name=type_details[1], symbol='::'.join(type_details[2:]))
+
+
+async def add_coin(balance: Balance, coin_type: Coin, obj_id: ObjectID) -> None:
+    if coin_type.name == 'sui':
+        if balance.coin:
+            balance.coin.balance += obj_id.amount
+            balance.coin.object_ids.append(obj_id)
+
+        else:
+            balance.coin = Coin(name=coin_type.name, symbol=coin_type.symbol, package_id=coin_type.package_id,
+                                balance=obj_id.amount, object_ids=[obj_id])
+
+    else:
+        if coin_type.name in balance.tokens:
+            coin = balance.tokens[coin_type.name]
+            coin.balance += obj_id.amount
+            coin.object_ids.append(obj_id)
+
+        else:
+            balance.tokens[coin_type.name] = Coin(name=coin_type.name, symbol=coin_type.symbol,
+                                                  package_id=coin_type.package_id, balance=obj_id.amount,
+                                                  object_ids=[obj_id])
+
+
+async def get_effects(response: Optional[dict]) -> Optional[dict]:
+    if not response:
+        return None
+
+    effects = response.get('result', response)
+    if not isinstance(effects, dict):
+        return None
+
+    effects = effects.get('EffectsCert', effects)
+    while isinstance(effects, dict) and 'status' not in effects and 'effects' in effects:
+        effects = effects['effects']
+
+    if isinstance(effects, dict) and 'status' in effects:
+        return effects
+
+
+async def get_digest(response: Optional[dict]) -> Optional[str]:
+    if not response:
+        return None
+
+    result = response.get('result', response)
+    if not isinstance(result, dict):
+        return None
+
+    if 'ImmediateReturn' in result:
+        return result['ImmediateReturn'].get('tx_digest')
+
+    certificate = (result.get('TxCert') or result.get('EffectsCert') or result).get('certificate')
+    if isinstance(certificate, dict):
+        return certificate.get('transactionDigest')
+
+
+class AdaptiveBatchSize:
+    def __init__(self, size: int = 200, min_size: int = 10, max_size: int = 1_000,
+                 target_latency: float = 1.0) -> None:
+        self.size = size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+
+    def success(self, size: int, latency: float) -> None:
+        if size >= self.size and latency < self.target_latency:
+            self.size = min(self.max_size, int(self.size * 1.25) + 1)
+
+    def shrink(self, size: int) -> None:
+        self.size = max(self.min_size, min(self.size, size // 2))
+
+
+async def get_results(responses: List[dict]) -> list:
+    results = []
+    for response in responses:
+        if 'error' in response:
+            error = response['error']
+            raise exceptions.RPCException(code=error['code'], message=error['message'])
+
+        results.append(response['result'])
+
+    return results
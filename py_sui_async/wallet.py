@@ -1,113 +1,137 @@
+import asyncio
 import logging
-from typing import Optional, List
+import time
+import urllib.request
+from typing import Optional, List, AsyncIterator, Tuple, Set
+from urllib.parse import urlparse
 
-import aiohttp
 from pretty_utils.type_functions.lists import split_list
 
 from py_sui_async import exceptions
+from py_sui_async.gas_price import GasPriceCache
 from py_sui_async.models import Balance, Coin, Nft, ObjectID
+from py_sui_async.pagination import iter_all_coins
 from py_sui_async.rpc_methods import RPC
-from py_sui_async.utils import parse_type
+from py_sui_async.utils import parse_type, parse_coin_type, add_coin, get_effects, AdaptiveBatchSize
 
 
 class Wallet:
-    def __init__(self, client):
+    def __init__(self, client, max_concurrency: int = 10):
         self.client = client
+        self.max_concurrency = max_concurrency
+        self.batch_size = AdaptiveBatchSize()
+        self.gas_pool: Set[str] = set()
+        self.gas_pool_size = 0
+        self.gas_pool_amount = 0
+        self.gas_pool_refill_below = 0
+        self._gas_pool_lock: Optional[asyncio.Lock] = None
+        self._gas_pool_task: Optional[asyncio.Future] = None
+
+    async def _get_objects_batch(self, object_ids: List[str], semaphore: asyncio.Semaphore) -> tuple:
+        async with semaphore:
+            queries = [await RPC.getObject(client=self.client, object_id=object_id, get_json=True) for object_id in
+                       object_ids]
+            start = time.monotonic()
+            try:
+                objs = await RPC.async_post(client=self.client, json_data=queries)
+                self.batch_size.success(size=len(object_ids), latency=time.monotonic() - start)
+                return object_ids, objs, None
+
+            except exceptions.RPCException as e:
+                return object_ids, None, e
+
+    async def iter_objects(self, object_ids: List[str]) -> AsyncIterator[dict]:
+        if not object_ids:
+            return
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        pending = {asyncio.ensure_future(self._get_objects_batch(object_ids=chunk, semaphore=semaphore)) for chunk in
+                   split_list(object_ids, self.batch_size.size)}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    chunk, objs, error = task.result()
+                    if error:
+                        if not error.oversized or len(chunk) <= self.batch_size.min_size:
+                            raise error
+
+                        self.batch_size.shrink(len(chunk))
+                        pending |= {
+                            asyncio.ensure_future(self._get_objects_batch(object_ids=sub_chunk, semaphore=semaphore))
+                            for sub_chunk in split_list(chunk, self.batch_size.size)
+                        }
+                        continue
+
+                    for obj in objs:
+                        yield obj
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    async def _add_object(balance: Balance, obj: dict) -> None:
+        obj_reference = obj['result']['details']['reference']
+        obj_id = obj_reference['objectId']
+        obj_data = obj['result']['details']['data']
+        obj_type = await parse_type(obj_data['type'])
+        obj_fields = obj_data['fields']
+        if obj_type.module == 'coin' and isinstance(obj_type.structure, Coin):
+            obj_id = ObjectID(id=obj_id, amount=obj_fields['balance'], version=obj_reference.get('version'),
+                              digest=obj_reference.get('digest'))
+            await add_coin(balance=balance, coin_type=obj_type.structure, obj_id=obj_id)
+
+        elif obj_type.module == 'devnet_nft':
+            balance.nfts[obj_id] = Nft(name=obj_fields['name'], description=obj_fields['description'],
+                                       image_url=obj_fields['url'], object_id=obj_id)
 
-    async def balance(self, address: Optional[str] = None) -> Balance:
+        else:
+            balance.misc[obj_id] = obj_data
+
+    async def _add_coins(self, balance: Balance, address: str) -> None:
+        async for coin in iter_all_coins(client=self.client, owner=address):
+            obj_id = ObjectID(id=coin['coinObjectId'], amount=coin['balance'], version=coin.get('version'),
+                              digest=coin.get('digest'))
+            await add_coin(balance=balance, coin_type=await parse_coin_type(coin['coinType']), obj_id=obj_id)
+
+    async def balance(self, address: Optional[str] = None,
+                      what: Tuple[str, ...] = ('coins', 'nfts', 'misc')) -> Balance:
         balance = Balance(tokens={}, nfts={}, misc={})
-        try:
-            if not address:
-                address = self.client.account.address
+        if not address:
+            address = self.client.account.address
 
+        if 'coins' in what:
+            await self._add_coins(balance=balance, address=address)
+
+        if 'nfts' in what or 'misc' in what:
             response = await RPC.getObjectsOwnedByAddress(client=self.client, address=address)
             if response['result']:
-                queries = [await RPC.getObject(client=self.client, object_id=obj['objectId'], get_json=True) for obj in
-                           response['result']]
-                query_list = split_list(queries, 200)
-                objs = []
-                for json_data in query_list:
-                    objs += await RPC.async_post(client=self.client, json_data=json_data)
-
-                for obj in objs:
-                    obj_id = obj['result']['details']['reference']['objectId']
-                    obj_data = obj['result']['details']['data']
-                    obj_type = await parse_type(obj_data['type'])
-                    obj_fields = obj_data['fields']
-                    if obj_type.module == 'coin':
-                        obj_balance = int(obj_fields['balance'])
-                        obj_id = ObjectID(id=obj_id, amount=obj_balance)
-                        if obj_type.structure.name == 'sui':
-                            if balance.coin:
-                                balance.coin.balance += obj_balance
-                                balance.coin.object_ids.append(obj_id)
-
-                            else:
-                                balance.coin = Coin(name=obj_type.structure.name, symbol=obj_type.structure.symbol,
-                                                    package_id=obj_type.structure.package_id,
-                                                    balance=obj_balance, object_ids=[obj_id])
-
-                        else:
-                            if obj_type.structure.name in balance.tokens:
-                                coin = balance.tokens[obj_type.structure.name]
-                                coin.balance += obj_balance
-                                coin.object_ids.append(obj_id)
-
-                            else:
-                                balance.tokens[obj_type.structure.name] = Coin(name=obj_type.structure.name,
-                                                                               symbol=obj_type.structure.symbol,
-                                                                               package_id=obj_type.structure.package_id,
-                                                                               balance=obj_balance, object_ids=[obj_id])
-
-                    elif obj_type.module == 'devnet_nft':
-                        balance.nfts[obj_id] = Nft(name=obj_fields['name'], description=obj_fields['description'],
-                                                   image_url=obj_fields['url'], object_id=obj_id)
-
-                    else:
-                        balance.misc[obj_id] = obj_data
+                object_ids = [obj['objectId'] for obj in response['result'] if
+                              not obj.get('type', '').startswith('0x2::coin::Coin<')]
+                async for obj in self.iter_objects(object_ids):
+                    await self._add_object(balance=balance, obj=obj)
 
-        except:
-            logging.exception('balance')
+            if 'nfts' not in what:
+                balance.nfts = {}
 
-        finally:
-            return balance
+            if 'misc' not in what:
+                balance.misc = {}
+
+        return balance
+
+    async def coins(self) -> Balance:
+        if self.client.object_store:
+            return await self.client.object_store.balance()
+
+        return await self.balance(what=('coins',))
 
     async def find_pay_object(self, amount: int, balance: Optional[Balance] = None,
                               excluding: Optional[str or List[str]] = '') -> Optional[str]:
         if not balance:
-            coin = None
-            response = await RPC.getObjectsOwnedByAddress(client=self.client, address=self.client.account.address)
-            if response['result']:
-                queries = [await RPC.getObject(client=self.client, object_id=obj['objectId'], get_json=True) for obj in
-                           response['result']]
-                query_list = split_list(queries, 200)
-                objs = []
-                for json_data in query_list:
-                    objs += await RPC.async_post(client=self.client, json_data=json_data)
-
-                for obj in objs:
-                    obj_id = obj['result']['details']['reference']['objectId']
-                    obj_data = obj['result']['details']['data']
-                    obj_type = await parse_type(obj_data['type'])
-                    obj_fields = obj_data['fields']
-                    if obj_type.module == 'coin' and obj_type.structure.name == 'sui':
-                        obj_balance = int(obj_fields['balance'])
-                        obj_id = ObjectID(id=obj_id, amount=obj_balance)
-                        if coin:
-                            coin.balance += obj_balance
-                            coin.object_ids.append(obj_id)
-
-                        else:
-                            coin = Coin(name=obj_type.structure.name, symbol=obj_type.structure.symbol,
-                                        package_id=obj_type.structure.package_id, balance=obj_balance,
-                                        object_ids=[obj_id])
-
-            else:
-                coin = None
-
-        else:
-            coin = balance.coin
+            balance = await self.coins()
 
+        coin = balance.coin
         if not coin:
             raise exceptions.NoObjects()
 
@@ -123,28 +147,108 @@ class Wallet:
             if object_instance.amount >= amount:
                 return object_instance.id
 
+    async def reference_gas_price(self) -> int:
+        return await GasPriceCache.for_network(self.client.network).get(self.client)
+
     async def find_object_for_gas(self, gas_budget: int = 10_000, gas_price: Optional[int] = None,
                                   balance: Optional[Balance] = None,
                                   excluding: Optional[str or List[str]] = '') -> Optional[str]:
         if not gas_price:
-            gas_price: int = (await RPC.getReferenceGasPrice(client=self.client))['result']
+            gas_price = await self.reference_gas_price()
 
         return await self.find_pay_object(amount=gas_budget * gas_price, balance=balance, excluding=excluding)
 
+    async def provision_gas_pool(self, n: int, amount_each: int, refill_below: Optional[int] = None,
+                                 gas_budget: int = 1_000, gas_price: Optional[int] = None) -> List[str]:
+        self.gas_pool_size = n
+        self.gas_pool_amount = amount_each
+        self.gas_pool_refill_below = amount_each // 4 if refill_below is None else refill_below
+        return await self.top_up_gas_pool(gas_budget=gas_budget, gas_price=gas_price)
+
+    async def top_up_gas_pool(self, gas_budget: int = 1_000, gas_price: Optional[int] = None) -> List[str]:
+        if not self._gas_pool_lock:
+            self._gas_pool_lock = asyncio.Lock()
+
+        async with self._gas_pool_lock:
+            balance = await self.coins()
+            coins = {obj.id: obj.amount for obj in balance.coin.object_ids} if balance.coin else {}
+            self.gas_pool = {object_id for object_id in self.gas_pool if
+                             coins.get(object_id, 0) >= self.gas_pool_refill_below}
+            missing = self.gas_pool_size - len(self.gas_pool)
+            if missing <= 0:
+                return list(self.gas_pool)
+
+            if not gas_price:
+                gas_price = await self.reference_gas_price()
+
+            amount = missing * self.gas_pool_amount + gas_budget * gas_price
+            reserved = None
+            if self.client.reservations:
+                reserved = await self.client.reservations.acquire(amount=amount, single=False,
+                                                                  excluding=list(self.gas_pool))
+                input_coins = [coin.object_id for coin in reserved]
+
+            else:
+                input_coins = []
+                total = 0
+                for object_id, coin_amount in sorted(coins.items(), key=lambda item: item[1], reverse=True):
+                    if object_id not in self.gas_pool and total < amount:
+                        input_coins.append(object_id)
+                        total += coin_amount
+
+                if total < amount:
+                    raise exceptions.InsufficientBalance('Not enough coins to provision the gas pool!')
+
+            try:
+                response = await self.client.transactions.pay_sui(
+                    input_coins=input_coins, recipients=[self.client.account.address] * missing,
+                    amounts=[self.gas_pool_amount] * missing, gas_budget=gas_budget, gas_price=gas_price,
+                    balance=balance
+                )
+
+            finally:
+                if reserved:
+                    await self.client.reservations.release(reserved)
+
+            effects = await get_effects(response)
+            for entry in (effects or {}).get('created') or []:
+                owner = entry.get('owner')
+                if isinstance(owner, dict) and owner.get('AddressOwner') == self.client.account.address:
+                    self.gas_pool.add(entry['reference']['objectId'])
+
+            return list(self.gas_pool)
+
+    def schedule_gas_pool_top_up(self) -> None:
+        if self.gas_pool_size and (not self._gas_pool_task or self._gas_pool_task.done()):
+            self._gas_pool_task = asyncio.ensure_future(self._top_up_gas_pool_in_background())
+
+    async def _top_up_gas_pool_in_background(self) -> None:
+        try:
+            await self.top_up_gas_pool()
+
+        except:
+            logging.exception('top_up_gas_pool')
+
     async def request_coins_from_faucet(self) -> Optional[dict]:
         if self.client.network.faucet:
             json_data = {
                 "FixedAmountRequest": {"recipient": self.client.account.address}
             }
 
-            async with aiohttp.ClientSession(trust_env=True, headers=self.client.headers) as session:
-                async with session.post(self.client.network.faucet, proxy=self.client.proxy,
-                                        json=json_data) as response:
-                    if response.status <= 201:
-                        return await response.json()
+            proxy = self.client.proxy
+            if not proxy:
+                url = urlparse(self.client.network.faucet)
+                if not urllib.request.proxy_bypass(url.hostname or ''):
+                    proxy = urllib.request.getproxies().get(url.scheme)
+
+            session = await self.client.transport.get_session()
+            async with session.post(self.client.network.faucet, headers=self.client.headers, proxy=proxy,
+                                    json=json_data) as response:
+                if response.status <= 201:
+                    return await response.json()
 
-                    else:
-                        raise exceptions.RPCException(response)
+                else:
+                    raise exceptions.RPCException(response)
 
         else:
             raise exceptions.FaucetException("You didn't specify the faucet URL!")
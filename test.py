@@ -1,11 +1,14 @@
 import asyncio
+import base64
 import os
 from typing import Optional
 
 from dotenv import load_dotenv
 
+from py_sui_async.bcs import TransactionBuilder, ObjectArg, Pure
 from py_sui_async.client import Client
 from py_sui_async.models import Nft
+from py_sui_async.rpc_methods import RPC
 
 
 class Test:
@@ -35,197 +38,260 @@ Coin:
     @staticmethod
     async def balance(address: str):
         """Show balance."""
-        client = Client('')
+        async with Client('') as client:
+            balance = await client.wallet.balance(address)
 
-        balance = await client.wallet.balance(address)
-
-        await Test.print_balance(balance)
-        print('----------------------------------------------------------------------------')
+            await Test.print_balance(balance)
+            print('----------------------------------------------------------------------------')
 
     @staticmethod
     async def generate_wallet():
-        client = Client()
-        print(client.account)
+        async with Client() as client:
+            print(client.account)
 
-        print('----------------------------------------------------------------------------')
+            print('----------------------------------------------------------------------------')
 
     @staticmethod
     async def request_sui_coins():
-        client = Client(mnemonic, proxy)
-        print(client.account)
+        async with Client(mnemonic, proxy) as client:
+            print(client.account)
 
-        print(await client.wallet.request_coins_from_faucet())
-        await Test.my_balance()
+            print(await client.wallet.request_coins_from_faucet())
+            await Test.my_balance()
 
-        print('----------------------------------------------------------------------------')
+            print('----------------------------------------------------------------------------')
 
     @staticmethod
     async def my_balance():
-        client = Client(mnemonic, proxy)
-        print(client.account)
+        async with Client(mnemonic, proxy) as client:
+            print(client.account)
 
-        balance = await client.wallet.balance()
-        await Test.print_balance(balance)
-        print('----------------------------------------------------------------------------')
+            balance = await client.wallet.balance()
+            await Test.print_balance(balance)
+            print('----------------------------------------------------------------------------')
 
     @staticmethod
     async def mint_example_nft():
-        client = Client(mnemonic, proxy)
-        print(client.account)
+        async with Client(mnemonic, proxy) as client:
+            print(client.account)
 
-        balance = await client.wallet.balance()
-        for obj_id, value in balance.nfts.items():
-            print(obj_id, value)
+            balance = await client.wallet.balance()
+            for obj_id, value in balance.nfts.items():
+                print(obj_id, value)
 
-        print()
+            print()
 
-        print(await client.nfts.mint_example_nft())
-        balance = await client.wallet.balance()
-        for obj_id, value in balance.nfts.items():
-            print(obj_id, value)
+            print(await client.nfts.mint_example_nft())
+            balance = await client.wallet.balance()
+            for obj_id, value in balance.nfts.items():
+                print(obj_id, value)
 
-        print('----------------------------------------------------------------------------')
+            print('----------------------------------------------------------------------------')
 
     @staticmethod
     async def mint_wizard_nft():
-        client = Client(mnemonic, proxy)
-        print(client.account)
+        async with Client(mnemonic, proxy) as client:
+            print(client.account)
 
-        balance = await client.wallet.balance()
-        for obj_id, value in balance.nfts.items():
-            print(obj_id, value)
+            balance = await client.wallet.balance()
+            for obj_id, value in balance.nfts.items():
+                print(obj_id, value)
 
-        print()
+            print()
 
-        nft = Nft(arguments=["Wizard Land", "Expanding The Magic Land",
-                             "https://gateway.pinata.cloud/ipfs/QmYfw8RbtdjPAF3LrC6S3wGVwWgn6QKq4LGS4HFS55adU2?w=800&h=450&c=crop"])
-        await client.nfts.mint(nft=nft)
-        balance = await client.wallet.balance()
-        for obj_id, value in balance.nfts.items():
-            print(obj_id, value)
+            nft = Nft(arguments=["Wizard Land", "Expanding The Magic Land",
+                                 "https://gateway.pinata.cloud/ipfs/QmYfw8RbtdjPAF3LrC6S3wGVwWgn6QKq4LGS4HFS55adU2?w=800&h=450&c=crop"])
+            await client.nfts.mint(nft=nft)
+            balance = await client.wallet.balance()
+            for obj_id, value in balance.nfts.items():
+                print(obj_id, value)
 
-        print('----------------------------------------------------------------------------')
+            print('----------------------------------------------------------------------------')
 
     @staticmethod
     async def mint_bluemove_nft():
-        client = Client(mnemonic, proxy)
-        print(client.account)
+        async with Client(mnemonic, proxy) as client:
+            print(client.account)
 
-        balance = await client.wallet.balance()
-        for obj_id, value in balance.nfts.items():
-            print(obj_id, value)
+            balance = await client.wallet.balance()
+            for obj_id, value in balance.nfts.items():
+                print(obj_id, value)
 
-        print()
-        arguments = ['0x081e876200a657e173397f722aba3b6628c6d270', 1]
-        await client.transactions.move_call(package_object_id='0x3c2468cdc0288983f099a52fc6f5b43e4ed0c959',
-                                            module='bluemove_launchpad', function='mint_with_quantity',
-                                            type_arguments=[],
-                                            arguments=arguments, gas_budget=50_000)
+            print()
+            arguments = ['0x081e876200a657e173397f722aba3b6628c6d270', 1]
+            await client.transactions.move_call(package_object_id='0x3c2468cdc0288983f099a52fc6f5b43e4ed0c959',
+                                                module='bluemove_launchpad', function='mint_with_quantity',
+                                                type_arguments=[],
+                                                arguments=arguments, gas_budget=50_000)
 
-        balance = await client.wallet.balance()
-        for obj_id, value in balance.nfts.items():
-            print(obj_id, value)
+            balance = await client.wallet.balance()
+            for obj_id, value in balance.nfts.items():
+                print(obj_id, value)
 
-        print('----------------------------------------------------------------------------')
+            print('----------------------------------------------------------------------------')
 
     @staticmethod
     async def send_coin():
-        client = Client(mnemonic, proxy)
-        print(client.account)
+        async with Client(mnemonic, proxy) as client:
+            print(client.account)
 
-        balance = await client.wallet.balance()
-        print(balance.coin)
+            balance = await client.wallet.balance()
+            print(balance.coin)
 
-        print(await client.transactions.send_coin(client.account.address, 100_000))
+            print(await client.transactions.send_coin(client.account.address, 100_000))
 
-        balance = await client.wallet.balance()
-        print(balance.coin)
+            balance = await client.wallet.balance()
+            print(balance.coin)
 
-        print('----------------------------------------------------------------------------')
+            print('----------------------------------------------------------------------------')
 
     @staticmethod
     async def send_token(token: str):
-        client = Client(mnemonic, proxy)
-        print(client.account)
+        async with Client(mnemonic, proxy) as client:
+            print(client.account)
 
-        balance = await client.wallet.balance()
-        print(balance.tokens[token])
+            balance = await client.wallet.balance()
+            print(balance.tokens[token])
 
-        print(await client.transactions.send_token(balance.tokens[token], client.account.address, 10_000))
+            print(await client.transactions.send_token(balance.tokens[token], client.account.address, 10_000))
 
-        balance = await client.wallet.balance()
-        print(balance.coin)
+            balance = await client.wallet.balance()
+            print(balance.coin)
 
-        print('----------------------------------------------------------------------------')
+            print('----------------------------------------------------------------------------')
 
     @staticmethod
     async def send_nft(nft: str):
-        client = Client(mnemonic, proxy)
-        print(client.account)
+        async with Client(mnemonic, proxy) as client:
+            print(client.account)
 
-        balance = await client.wallet.balance()
-        for obj_id, value in balance.nfts.items():
-            print(obj_id, value)
+            balance = await client.wallet.balance()
+            for obj_id, value in balance.nfts.items():
+                print(obj_id, value)
 
-        print(await client.transactions.send_nft(balance.nfts[nft], client.account.address))
+            print(await client.transactions.send_nft(balance.nfts[nft], client.account.address))
 
-        balance = await client.wallet.balance()
-        for obj_id, value in balance.nfts.items():
-            print(obj_id, value)
+            balance = await client.wallet.balance()
+            for obj_id, value in balance.nfts.items():
+                print(obj_id, value)
 
-        print('----------------------------------------------------------------------------')
+            print('----------------------------------------------------------------------------')
 
     @staticmethod
     async def merge_coin():
-        client = Client(mnemonic, proxy)
-        print(client.account)
+        async with Client(mnemonic, proxy) as client:
+            print(client.account)
 
-        balance = await client.wallet.balance()
-        print(balance.coin)
+            balance = await client.wallet.balance()
+            print(balance.coin)
 
-        print(await client.transactions.merge_coin(balance.coin))
+            print(await client.transactions.merge_coin(balance.coin))
 
-        balance = await client.wallet.balance()
-        print(balance.coin)
+            balance = await client.wallet.balance()
+            print(balance.coin)
 
-        print('----------------------------------------------------------------------------')
+            print('----------------------------------------------------------------------------')
 
     @staticmethod
     async def merge_token(token: str):
-        client = Client(mnemonic, proxy)
-        print(client.account)
+        async with Client(mnemonic, proxy) as client:
+            print(client.account)
 
-        balance = await client.wallet.balance()
-        print(balance.tokens[token])
+            balance = await client.wallet.balance()
+            print(balance.tokens[token])
 
-        print(await client.transactions.merge_coin(balance.tokens[token]))
+            print(await client.transactions.merge_coin(balance.tokens[token]))
 
-        balance = await client.wallet.balance()
-        print(balance.tokens[token])
+            balance = await client.wallet.balance()
+            print(balance.tokens[token])
 
-        print('----------------------------------------------------------------------------')
+            print('----------------------------------------------------------------------------')
 
     @staticmethod
-    async def history(address: Optional[str] = None):
-        if address:
-            client = Client('')
-
-        else:
-            client = Client(mnemonic, proxy)
+    async def bcs_golden_vectors(token: str):
+        """Compare locally built txBytes with the ones the node builds for every transaction kind."""
+        async with Client(mnemonic, proxy) as client:
             print(client.account)
 
-        history = await client.transactions.history(address)
-        print(f'Incoming ({len(history.incoming)}):')
-        for tx in history.incoming:
-            print(tx)
+            address = client.account.address
+            balance = await client.wallet.coins()
+            coins = sorted(balance.coin.object_ids, key=lambda obj: obj.amount, reverse=True)
+            tokens = balance.tokens[token].object_ids if token in balance.tokens else []
+            if len(coins) < 3 or not tokens:
+                print(f'At least 3 SUI coins and one {token} coin are needed to compare every kind!')
+                return
+
+            gas, first, second = coins[:3]
+            gas_price = await client.wallet.reference_gas_price()
+            builder = TransactionBuilder(address)
+            package = await client.transactions._package_ref('0x2')
+            cases = {
+                'TransferObject': (
+                    await RPC.transferObject(client=client, signer=address, object_id=first.id, recipient=address,
+                                             gas=gas.id, gas_budget=1_000),
+                    builder.transfer_object(recipient=address, obj=first), gas, 1_000
+                ),
+                'PaySui': (
+                    await RPC.paySui(client=client, signer=address, input_coins=[gas.id, first.id],
+                                     recipients=[address], amounts=[1_000], gas_budget=1_000),
+                    builder.pay_sui(coins=[gas, first], recipients=[address], amounts=[1_000]), gas, 1_000
+                ),
+                'Pay': (
+                    await RPC.pay(client=client, signer=address, input_coins=[obj.id for obj in tokens],
+                                  recipients=[address], amounts=[1], gas=gas.id, gas_budget=1_000),
+                    builder.pay(coins=tokens, recipients=[address], amounts=[1]), gas, 1_000
+                ),
+                'PayAllSui': (
+                    await RPC.payAllSui(client=client, signer=address, input_coins=[gas.id, first.id],
+                                        recipient=address, gas_budget=1_000),
+                    builder.pay_all_sui(coins=[gas, first], recipient=address), gas, 1_000
+                ),
+                'MoveCall': (
+                    await RPC.moveCall(client=client, signer=address, package_object_id='0x2', module='pay',
+                                       function='split', type_arguments=['0x2::sui::SUI'], arguments=[first.id, 1_000],
+                                       gas=gas.id, gas_budget=10_000),
+                    builder.move_call(package=package, module='pay', function='split', type_arguments=['0x2::sui::SUI'],
+                                      arguments=[ObjectArg(first), Pure(1_000)]), gas, 10_000
+                ),
+                'Batch': (
+                    await RPC.batchTransaction(client=client, signer=address, single_transaction_params=[
+                        {'transferObjectRequestParams': {'recipient': address, 'objectId': first.id}},
+                        {'transferObjectRequestParams': {'recipient': address, 'objectId': second.id}}
+                    ], gas=gas.id, gas_budget=1_000),
+                    [builder.transfer_object(recipient=address, obj=first),
+                     builder.transfer_object(recipient=address, obj=second)], gas, 1_000
+                )
+            }
+            for name, (response, kind, gas_ref, gas_budget) in cases.items():
+                expected = response['result']['txBytes']
+                built = base64.b64encode(builder.build(kinds=kind, gas=gas_ref, gas_price=gas_price,
+                                                       gas_budget=gas_budget)).decode()
+                if built == expected:
+                    print(f'{name}: OK')
+
+                else:
+                    print(f'{name}: MISMATCH\n  node:  {expected}\n  local: {built}')
+
+            print('----------------------------------------------------------------------------')
+
+    @staticmethod
+    async def history(address: Optional[str] = None):
+        async with Client('') if address else Client(mnemonic, proxy) as client:
+            if not address:
+                print(client.account)
+
+            history = await client.transactions.history(address)
+            print(f'Incoming ({len(history.incoming)}):')
+            for tx in history.incoming:
+                print(tx)
 
-        print()
+            print()
 
-        print(f'Outgoing ({len(history.outgoing)}):')
-        for tx in history.outgoing:
-            print(tx)
+            print(f'Outgoing ({len(history.outgoing)}):')
+            for tx in history.outgoing:
+                print(tx)
 
-        print('----------------------------------------------------------------------------')
+            print('----------------------------------------------------------------------------')
 
 
 async def main():
@@ -242,6 +308,7 @@ async def main():
     await test.send_nft('0x1c47664b9b12fca8ede96726b6d90c854ae512a7')
     await test.merge_coin()
     await test.merge_token('usdt')
+    await test.bcs_golden_vectors('usdt')
     await test.history()
     await test.history('0x0f2df809112256ec9068c2663bc4901c8a1b3ce7')
 